@@ -53,6 +53,9 @@ class Settings:
     CONFIG_API_URL: str = os.getenv("CONFIG_API_URL", "http://gta5rp.leetpc.com")
     CONFIG_API_SECRET: str = os.getenv("CONFIG_API_SECRET", "gta5rp_api_secret_2025")
     
+    # Сжимать тело sync_profile gzip'ом (только если сервер поддерживает Content-Encoding)
+    SYNC_GZIP: bool = os.getenv("SYNC_GZIP", "0") == "1"
+    
     # Версия клиента
     VERSION: str = "2.0.0"
     
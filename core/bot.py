@@ -814,7 +814,7 @@ class VirtBot:
             try:
                 result = subprocess.run(
                     ["taskkill", "/F", "/IM", proc_name, "/T"],
-                    capture_output=True, text=True, timeout=5
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
                 )
                 return result.returncode == 0
             except:
@@ -837,9 +837,9 @@ class VirtBot:
                 # Убираем .exe для Get-Process
                 name_no_ext = proc_name.replace('.exe', '').replace('.EXE', '')
                 cmd = f"Get-Process -Name '{name_no_ext}' -ErrorAction SilentlyContinue | Stop-Process -Force"
-                result = subprocess.run(
+                subprocess.run(
                     ["powershell", "-Command", cmd],
-                    capture_output=True, text=True, timeout=10
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10
                 )
                 return True  # PowerShell не возвращает ошибку если процесса нет
             except:
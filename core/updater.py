@@ -147,7 +147,8 @@ del "%~f0"
             subprocess.run(
                 ["git", "fetch"],
                 cwd=self.app_dir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30
             )
             
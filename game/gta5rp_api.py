@@ -1,8 +1,15 @@
+import asyncio
+import json
 import httpx
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 import time
+from config import DATA_DIR
 from utils import get_logger
+from utils.http import HTTP2_AVAILABLE
+
+# Серверы, на которых у аккаунта есть персонажи: login -> {"servers": [...], "discovery": n}
+KNOWN_SERVERS_FILE = DATA_DIR / "gta5rp_known_servers.json"
 
 
 @dataclass
@@ -48,8 +55,14 @@ class GTA5RPAPI:
     }
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30)
+        # Параллельные запросы по серверам идут потоками одного HTTP/2 соединения
+        self.client = httpx.AsyncClient(
+            timeout=30,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
         self.token: Optional[str] = None
+        self.login_name: Optional[str] = None
         self.logger = get_logger()
     
     async def login(self, login: str, password: str) -> bool:
@@ -63,6 +76,7 @@ class GTA5RPAPI:
             
             if "token" in data:
                 self.token = data["token"]
+                self.login_name = login
                 self.logger.info("✅ GTA5RP login successful")
                 return True
             else:
@@ -73,49 +87,105 @@ class GTA5RPAPI:
             self.logger.error(f"GTA5RP login error: {e}")
             return False
     
-    async def get_profiles(self) -> List[Profile]:
-        """Получить все профили со всех серверов"""
+    async def get_profiles(self, full_scan: bool = False) -> List[Profile]:
+        """
+        Получить профили аккаунта.
+        
+        Запрашиваются только серверы, где персонажи уже находились, плюс один
+        "разведочный" сервер по кругу — так новые персонажи тоже найдутся.
+        full_scan=True (или пустой список известных) — опросить все серверы.
+        """
         if not self.token:
             self.logger.error("Not logged in to GTA5RP")
             return []
         
-        profiles = []
+        known, discovery = self._load_known_servers()
+        if full_scan or not known:
+            server_ids = list(self.SERVERS)
+        else:
+            server_ids = [sid for sid in self.SERVERS if sid in known]
+            unknown = [sid for sid in self.SERVERS if sid not in known]
+            if unknown:
+                server_ids.append(unknown[discovery % len(unknown)])
         
-        for server_id, server_name in self.SERVERS.items():
-            try:
-                response = await self.client.get(
-                    f"{self.BASE_URL}/users/chars/{server_id}",
-                    headers={"x-access-token": self.token}
-                )
-                
-                if response.status_code != 200:
-                    continue
-                
-                data = response.json()
-                if not isinstance(data, list):
-                    continue
-                
-                for char in data:
-                    profiles.append(Profile(
-                        name=char.get("name", ""),
-                        server=server_name,
-                        lvl=char.get("lvl", 1),
-                        exp=char.get("exp", 0),
-                        money=char.get("cash", 0) + char.get("bank", 0),
-                        vip_type=self._get_vip_type(char.get("vip_level", 0)),
-                        vip_days=self._calc_vip_days(char.get("vip_expire_at", 0)),
-                        has_apartment=bool(char.get("apartment")),
-                        has_house=bool(char.get("house")),
-                        is_online=char.get("is_online", False)
-                    ))
-                    
-            except Exception as e:
-                self.logger.error(f"Error fetching server {server_name}: {e}")
-                continue
+        # Все серверы запрашиваем параллельно: время ≈ самый медленный ответ, а не сумма
+        results = await asyncio.gather(*(
+            self._get_server_profiles(server_id, self.SERVERS[server_id])
+            for server_id in server_ids
+        ))
         
-        self.logger.info(f"📊 Found {len(profiles)} profiles")
+        profiles = []
+        for server_id, server_profiles in zip(server_ids, results):
+            if server_profiles is None:
+                continue  # Ошибка запроса — статус сервера не меняем
+            if server_profiles:
+                known.add(server_id)
+                profiles.extend(server_profiles)
+            else:
+                known.discard(server_id)
+        self._save_known_servers(known, discovery + 1)
+        
+        self.logger.info(f"📊 Found {len(profiles)} profiles ({len(server_ids)} servers queried)")
         return profiles
     
+    def _load_known_servers(self) -> Tuple[Set[int], int]:
+        """Известные серверы аккаунта и счётчик разведки"""
+        try:
+            with open(KNOWN_SERVERS_FILE, 'r') as f:
+                entry = json.load(f).get(self.login_name or "", {})
+            return set(entry.get("servers", [])), entry.get("discovery", 0)
+        except Exception:
+            return set(), 0
+    
+    def _save_known_servers(self, known: Set[int], discovery: int):
+        """Сохранить известные серверы аккаунта"""
+        try:
+            with open(KNOWN_SERVERS_FILE, 'r') as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        data[self.login_name or ""] = {"servers": sorted(known), "discovery": discovery}
+        try:
+            with open(KNOWN_SERVERS_FILE, 'w') as f:
+                json.dump(data, f)
+        except Exception as e:
+            self.logger.warning(f"Failed to save known servers: {e}")
+    
+    async def _get_server_profiles(self, server_id: int, server_name: str) -> Optional[List[Profile]]:
+        """Профили одного сервера (None при ошибке запроса)"""
+        try:
+            response = await self.client.get(
+                f"{self.BASE_URL}/users/chars/{server_id}",
+                headers={"x-access-token": self.token}
+            )
+            
+            if response.status_code != 200:
+                return None
+            
+            data = response.json()
+            if not isinstance(data, list):
+                return None
+            
+            return [
+                Profile(
+                    name=char.get("name", ""),
+                    server=server_name,
+                    lvl=char.get("lvl", 1),
+                    exp=char.get("exp", 0),
+                    money=char.get("cash", 0) + char.get("bank", 0),
+                    vip_type=self._get_vip_type(char.get("vip_level", 0)),
+                    vip_days=self._calc_vip_days(char.get("vip_expire_at", 0)),
+                    has_apartment=bool(char.get("apartment")),
+                    has_house=bool(char.get("house")),
+                    is_online=char.get("is_online", False)
+                )
+                for char in data
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error fetching server {server_name}: {e}")
+            return None
+    
     async def get_user_info(self) -> Optional[dict]:
         """Получить информацию о пользователе"""
         if not self.token:
@@ -8,18 +8,31 @@ Key features:
 - Server-specific character queries
 """
 import json
+import os
 import time
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from config import DATA_DIR
 from utils import get_logger
+from utils.fastjson import loads as _loads, dumps as _dumps
 
 logger = get_logger(__name__)
 
+
+def _write_json_atomic(path: Path, obj: Any):
+    """Один write() готовых bytes во временный файл + os.replace (без полузаписанного JSON)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(_dumps(obj))
+    os.replace(tmp_path, path)
+
 # Session cache file
 SESSION_FILE = DATA_DIR / "gta5rp_session.json"
 
+# Characters + ETag/Last-Modified per "login:server_id" for conditional GET (304)
+CHARS_CACHE_FILE = DATA_DIR / "gta5rp_chars_cache.json"
+
 # GTA5RP API
 GTA5RP_API = "https://gta5rp.com/api/V2"
 
@@ -43,6 +56,9 @@ class GTA5RPSession:
         self.token = None
         self.login = None
         self.password = None
+        # Один пул соединений на весь процесс: TCP+TLS к API переиспользуется между вызовами
+        self._http = requests.Session()
+        self._chars_cache = None
         self._load_session()
     
     def _load_session(self):
@@ -65,15 +81,29 @@ class GTA5RPSession:
     def _save_session(self):
         """Save session to disk"""
         try:
-            SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(SESSION_FILE, 'w') as f:
-                json.dump({
-                    "token": self.token,
-                    "login": self.login
-                }, f)
+            _write_json_atomic(SESSION_FILE, {
+                "token": self.token,
+                "login": self.login
+            })
         except Exception as e:
             logger.warning(f"Failed to save session: {e}")
     
+    def _get_chars_cache(self) -> Dict[str, Any]:
+        """Load characters cache from disk (once)"""
+        if self._chars_cache is None:
+            try:
+                self._chars_cache = _loads(CHARS_CACHE_FILE.read_bytes())
+            except (OSError, ValueError):
+                self._chars_cache = {}
+        return self._chars_cache
+    
+    def _save_chars_cache(self):
+        """Save characters cache to disk"""
+        try:
+            _write_json_atomic(CHARS_CACHE_FILE, self._chars_cache)
+        except Exception as e:
+            logger.warning(f"Failed to save characters cache: {e}")
+    
     def login_if_needed(self, login: str, password: str, force: bool = False) -> bool:
         """
         Login to GTA5RP if token is missing.
@@ -90,10 +120,10 @@ class GTA5RPSession:
             url = f"{GTA5RP_API}/users/auth/login"
             payload = {"login": login, "password": password, "remember": "1"}  # ✅ Remember me!
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._http.post(url, json=payload, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads(response.content)
             if "token" not in data:
                 logger.error(f"Login failed: {data}")
                 return False
@@ -108,7 +138,7 @@ class GTA5RPSession:
             logger.info(f"✓ Logged in as {login} (remember=1, token valid ~30 days)")
             return True
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Login error: {e}")
             return False
     
@@ -121,7 +151,7 @@ class GTA5RPSession:
             url = f"{GTA5RP_API}/users/"
             headers = {"x-access-token": self.token}
             
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._http.get(url, headers=headers, timeout=30)
             
             # Token expired?
             if response.status_code == 401:
@@ -130,9 +160,9 @@ class GTA5RPSession:
                 return None
             
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Get user info error: {e}")
             return None
     
@@ -154,7 +184,16 @@ class GTA5RPSession:
             url = f"{GTA5RP_API}/users/chars/{server_id}"
             headers = {"x-access-token": self.token}
             
-            response = requests.get(url, headers=headers, timeout=15)
+            # Conditional GET: если данные не менялись, сервер ответит 304 без тела
+            cache_key = f"{self.login}:{server_id}"
+            cached = self._get_chars_cache().get(cache_key)
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            response = self._http.get(url, headers=headers, timeout=15)
             
             # Token expired?
             if response.status_code == 401:
@@ -162,12 +201,24 @@ class GTA5RPSession:
                 self.token = None
                 return []
             
-            if response.status_code != 200:
-                return []
-            
-            data = response.json()
-            if not isinstance(data, list):
+            if response.status_code == 304 and cached:
+                data = cached["chars"]
+            elif response.status_code != 200:
                 return []
+            else:
+                data = _loads(response.content)
+                if not isinstance(data, list):
+                    return []
+                
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._chars_cache[cache_key] = {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "chars": data,
+                    }
+                    self._save_chars_cache()
             
             # Add server info to each character
             for char in data:
@@ -176,7 +227,7 @@ class GTA5RPSession:
             
             return data
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Get characters error: {e}")
             return []
 
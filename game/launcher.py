@@ -61,13 +61,15 @@ def get_game_paths() -> dict:
 def is_process_running(process_name: str) -> bool:
     """Проверить запущен ли процесс"""
     try:
+        # /FI оставляет только совпавшие строки; в CSV они начинаются с кавычки,
+        # а "нет задач" — локализованное сообщение без кавычек
         result = subprocess.run(
-            ["tasklist", "/FI", f"IMAGENAME eq {process_name}"],
+            ["tasklist", "/FI", f"IMAGENAME eq {process_name}", "/FO", "CSV", "/NH"],
             capture_output=True,
             text=True,
             timeout=10
         )
-        return process_name.lower() in result.stdout.lower()
+        return result.stdout.lstrip().startswith('"')
     except Exception as e:
         logger.error(f"Error checking process {process_name}: {e}")
         return False
@@ -214,12 +216,13 @@ def run_exe(exe_path: str, cwd: str = None, wait: bool = False, timeout: int = N
         os.chdir(cwd)
         
         if wait:
+            # Вывод не нужен — только код возврата, поэтому без буферизации в pipe
             result = subprocess.run(
                 f'"{exe_path}"',
                 shell=True,
                 timeout=timeout,
-                capture_output=True,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             os.chdir(original_cwd)
             logger.info(f"   Exit code: {result.returncode}")
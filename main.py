@@ -15,6 +15,18 @@ IP_CHECK_RETRIES = 10
 IP_CHECK_INTERVAL = 30  # секунд
 
 
+def install_fast_event_loop():
+    """Поставить libuv event loop (winloop на Windows, uvloop иначе), если он установлен"""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    loop_impl.install()
+
+
 def print_startup_banner(logger):
     """Вывести баннер при старте"""
     logger.info("=" * 50)
@@ -32,7 +44,8 @@ def check_ip_with_retries(logger, retries: int = IP_CHECK_RETRIES, interval: int
         (status: IPStatus, ip: str, attempts: int)
     """
     for attempt in range(1, retries + 1):
-        status, ip = check_ip_access()
+        # Ждём смены IP (VPN) — кэш здесь только мешает
+        status, ip = check_ip_access(force_refresh=True)
         
         if status == IPStatus.ALLOWED:
             logger.info(f"✅ IP allowed on attempt {attempt}/{retries}: {ip}")
@@ -191,4 +204,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
     asyncio.run(main())
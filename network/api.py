@@ -1,8 +1,10 @@
+import asyncio
 import httpx
 import socket
 from typing import Optional, List, Dict, Any
 from config import settings
 from utils import get_logger
+from utils.ip_check import get_external_ip
 
 
 class APIClient:
@@ -25,7 +27,7 @@ class APIClient:
         try:
             payload = {
                 "name": self.pc_name,
-                "ip": self._get_external_ip(),
+                "ip": await self._get_external_ip(),
                 "status": status,
                 "current_server": str(current_server) if current_server else None,
                 "current_char": str(current_char) if current_char else None,
@@ -94,13 +96,14 @@ class APIClient:
             self.logger.error(f"Failed to sync accounts: {e}")
             return None
     
-    def _get_external_ip(self) -> str:
-        """Получить внешний IP"""
-        try:
-            response = httpx.get("https://api.ipify.org", timeout=5)
-            return response.text
-        except Exception:
-            return "unknown"
+    async def _get_external_ip(self) -> str:
+        """
+        Получить внешний IP.
+        Всегда свежий: после подключения/отключения VPN сервер должен сразу видеть новый IP.
+        Запрос синхронный (гонка сервисов до двух раундов) — выполняем в потоке, не блокируя event loop.
+        """
+        ip = await asyncio.to_thread(get_external_ip, force_refresh=True)
+        return ip or "unknown"
     
     async def close(self):
         """Закрыть соединение"""
@@ -0,0 +1,39 @@
+"""
+Dependency Bootstrap
+
+Installs the pinned dependencies from requirements.txt for the standalone
+scripts in this folder (getlvl.py, getmaxlvl.py, main.py, get_appartments.py, ...).
+The scripts themselves assume their dependencies are already installed.
+start.bat/update.bat install them from requirements.txt; run this only
+to repair an environment by hand.
+
+Usage:
+    python scripts/_bootstrap.py
+    python scripts/_bootstrap.py --reinstall   # повреждённая установка
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Один список зависимостей с версиями — тот же, что ставят start.bat/update.bat
+REQUIREMENTS = Path(__file__).resolve().parent.parent / "requirements.txt"
+
+
+def pip(*args: str) -> None:
+    subprocess.check_call([sys.executable, "-m", "pip", *args])
+
+
+def main() -> int:
+    if "--reinstall" in sys.argv:
+        # Без uninstall: бот не остаётся без requests/urllib3, если установка прервётся
+        print("Переустанавливаю библиотеки...", flush=True)
+        pip("install", "--force-reinstall", "-r", str(REQUIREMENTS))
+    else:
+        print("Устанавливаю библиотеки...", flush=True)
+        pip("install", "-r", str(REQUIREMENTS))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,48 +1,40 @@
-import json
-import subprocess
 from datetime import datetime
 from dataclasses import dataclass
 from typing import List
 import sys
 import time
 
-try:
-    import requests
-except ImportError:
-    print("Некоторые библиотеки не установлены. Устанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-except ValueError:
-    print("Некорректно установленные библиотеки. Переустанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "uninstall", "-r", "requirements.txt"])
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+import requests
 
-server_names = {
-    1: "01.Downtown",
-    2: "02.Strawberry",
-    3: "03.Vinewood",
-    4: "04.Blackberry",
-    5: "05.Insquad",
-    6: "06.Sunrise",
-    7: "07.Rainbow",
-    8: "08.Richman",
-    9: "09.Eclipse",
-    10: "10.LaMesa",
-    11: "11.Burton",
-    12: "12.Rockford",
-    13: "13.Alta",
-    14: "14.DelPerro",
-    15: "15.Davis",
-    16: "16.Harmony",
-    17: "17.Redwood",
-    18: "18.Hawick",
-    19: "19.Grapeseed",
-    20: "20.Murrieta",
-    21: "21.Vespucci",
-    22: "22.Milton"
-}
+# Индекс = server_id (1..22), 0 не используется
+SERVER_NAMES = (
+    None,
+    "01.Downtown",
+    "02.Strawberry",
+    "03.Vinewood",
+    "04.Blackberry",
+    "05.Insquad",
+    "06.Sunrise",
+    "07.Rainbow",
+    "08.Richman",
+    "09.Eclipse",
+    "10.LaMesa",
+    "11.Burton",
+    "12.Rockford",
+    "13.Alta",
+    "14.DelPerro",
+    "15.Davis",
+    "16.Harmony",
+    "17.Redwood",
+    "18.Hawick",
+    "19.Grapeseed",
+    "20.Murrieta",
+    "21.Vespucci",
+    "22.Milton",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     is_online: bool
     name: str
@@ -62,20 +54,25 @@ class Profile:
 
 
 def from_dict(data: dict, server_name: str) -> Profile:
-    # Удаляем ненужные поля
-    keys_to_remove = ["age", "id", "sex", "fraction", "fraction_rank", "fraction_rank_name", "friends",
-                      "skills",
-                      "is_vehicle_view_needed", "business"]
-    for key in keys_to_remove:
-        data.pop(key, None)
-
-    # Делаем house, apartment, vehicles булевыми
-    data["house"] = bool(data["house"])
-    data["apartment"] = bool(data["apartment"])
-    data["vehicles"] = bool(data["vehicles"])  # True, если есть машины, иначе False
-
-    data["server"] = server_name
-    return Profile(**data)
+    # Берём только нужные поля, остальное из ответа API игнорируется
+    return Profile(
+        is_online=data["is_online"],
+        name=data["name"],
+        server=server_name,
+        lvl=data["lvl"],
+        exp=data["exp"],
+        max_exp=data["max_exp"],
+        cash=data["cash"],
+        bank=data["bank"],
+        # Делаем house, apartment, vehicles булевыми
+        house=bool(data["house"]),
+        apartment=bool(data["apartment"]),
+        vehicles=bool(data["vehicles"]),  # True, если есть машины, иначе False
+        hours_played=data["hours_played"],
+        vip_level=data["vip_level"],
+        vip_name=data["vip_name"],
+        vip_expire_at=data["vip_expire_at"],
+    )
 
 
 def check_int(s):
@@ -90,12 +87,9 @@ def check_int(s):
 def get_profiles(login, password):
     # Login
     url = "https://gta5rp.com/api/V2/users/auth/login"
-    payload = "{\"login\": \"" + login + "\", \"password\": \"" + password + "\", \"remember\": \"0\"}"
-    headers = {
-        'content-type': "application/json"
-    }
-    response = requests.request("POST", url, data=payload, headers=headers)
-    account = json.loads(response.text)
+    payload = {"login": login, "password": password, "remember": "0"}
+    response = requests.request("POST", url, json=payload)
+    account = response.json()
     token = account["token"]
 
     profiles: List[Profile] = []
@@ -106,8 +100,10 @@ def get_profiles(login, password):
             'x-access-token': token
         }
         response = requests.request("GET", url, headers=headers)
-        json_data = json.loads(response.text)
-        profiles.extend(from_dict(data, server_names.get(x)) for data in json_data)
+        if not response.ok:
+            continue
+        json_data = response.json()
+        profiles.extend(from_dict(data, SERVER_NAMES[x]) for data in json_data)
     return profiles
 
 
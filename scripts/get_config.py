@@ -16,6 +16,7 @@ Returns:
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Добавляем parent в path для импорта
@@ -28,16 +29,16 @@ except ImportError:
     print("Error: Run from client directory")
     sys.exit(1)
 
-try:
-    import requests
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-except ImportError:
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "urllib3"])
-    import requests
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Общая сессия для config API: keep-alive + verify=False задаётся один раз
+SESSION = requests.Session()
+SESSION.verify = False
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=4))
 
 
 def get_external_ip() -> str:
@@ -54,6 +55,14 @@ def get_external_ip() -> str:
             return ""
 
 
+def warm_up_api() -> None:
+    """Заранее открыть соединение к config API (DNS + TCP/TLS), пока ждём IP"""
+    try:
+        SESSION.head(settings.CONFIG_API_URL, timeout=5)
+    except Exception:
+        pass  # Не критично — токен-запрос просто откроет соединение сам
+
+
 def get_jwt_token(ip: str) -> str:
     """Получить JWT токен для API"""
     try:
@@ -64,12 +73,11 @@ def get_jwt_token(ip: str) -> str:
         }
         headers = {"X-Forwarded-For": ip}
         
-        response = requests.post(
+        response = SESSION.post(
             token_url,
             json=token_data,
             headers=headers,
-            timeout=10,
-            verify=False
+            timeout=10
         )
         
         if response.status_code != 200:
@@ -92,11 +100,10 @@ def get_account_config(token: str, ip: str) -> dict:
             "X-Forwarded-For": ip
         }
         
-        response = requests.get(
+        response = SESSION.get(
             config_url,
             headers=headers,
-            timeout=10,
-            verify=False
+            timeout=10
         )
         
         if response.status_code != 200:
@@ -119,11 +126,10 @@ def get_google_credentials(token: str, ip: str) -> dict:
             "X-Forwarded-For": ip
         }
         
-        response = requests.get(
+        response = SESSION.get(
             creds_url,
             headers=headers,
-            timeout=10,
-            verify=False
+            timeout=10
         )
         
         if response.status_code != 200:
@@ -138,28 +144,32 @@ def get_google_credentials(token: str, ip: str) -> dict:
         return {}
 
 
+# Поля account.json (порядок сохраняется в файле)
+ACCOUNT_FIELDS = (
+    "active_character",
+    "email",
+    "password",
+    "imap",
+    "social_login",
+    "social_password",
+    "pcname",
+    "login",
+    "epic_login",
+    "epic_password",
+    # Server info (from virtapp_accounts via JOIN)
+    "server",
+    "server_hostname",
+)
+
+
 def save_account_config(config: dict) -> bool:
     """Сохранить конфигурацию аккаунта в JSON"""
     try:
-        account_data = {
-            "active_character": config.get("active_character", ""),
-            "email": config.get("email", ""),
-            "password": config.get("password", ""),
-            "imap": config.get("imap", ""),
-            "social_login": config.get("social_login", ""),
-            "social_password": config.get("social_password", ""),
-            "pcname": config.get("pcname", ""),
-            "login": config.get("login", ""),
-            "epic_login": config.get("epic_login", ""),
-            "epic_password": config.get("epic_password", ""),
-            # Server info (from virtapp_accounts via JOIN)
-            "server": config.get("server", ""),
-            "server_hostname": config.get("server_hostname", ""),
-        }
+        account_data = {key: config.get(key, "") for key in ACCOUNT_FIELDS}
         
         DATA_DIR.mkdir(exist_ok=True)
         with open(ACCOUNT_FILE, "w", encoding="utf-8") as f:
-            json.dump(account_data, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(account_data, indent=2, ensure_ascii=False))
         
         logger.info(f"✅ Account config saved to {ACCOUNT_FILE}")
         return True
@@ -176,8 +186,9 @@ def save_credentials(credentials: dict) -> bool:
             return True
         
         DATA_DIR.mkdir(exist_ok=True)
+        # json.dumps + один write вместо json.dump (write на каждый токен)
         with open(CREDENTIALS_FILE, "w", encoding="utf-8") as f:
-            json.dump(credentials, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(credentials, indent=2, ensure_ascii=False))
         
         logger.info(f"✅ Google credentials saved to {CREDENTIALS_FILE}")
         return True
@@ -214,8 +225,11 @@ def fetch_config() -> bool:
     logger.info("📦 Fetching Account Config")
     logger.info("=" * 50)
     
-    # 1. Получаем IP
-    external_ip = get_external_ip()
+    # 1. Получаем IP (параллельно прогреваем соединение к config API)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ip_future = executor.submit(get_external_ip)
+        executor.submit(warm_up_api)
+        external_ip = ip_future.result()
     if not external_ip:
         logger.error("❌ Failed to get external IP")
         return False
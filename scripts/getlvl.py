@@ -1,51 +1,54 @@
 import json
-import subprocess
 from datetime import datetime
 from dataclasses import dataclass
 from typing import List, Optional
 import sys
 import time
 
+import requests
+
+# orjson парсит bytes напрямую, без декодирования response.text
 try:
-    import requests
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    print("Installing required libraries...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
-    import requests
+    _loads = json.loads
 
 # Configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 REQUEST_TIMEOUT = 30
 
-server_names = {
-    1: "01.Downtown",
-    2: "02.Strawberry",
-    3: "03.Vinewood",
-    4: "04.Blackberry",
-    5: "05.Insquad",
-    6: "06.Sunrise",
-    7: "07.Rainbow",
-    8: "08.Richman",
-    9: "09.Eclipse",
-    10: "10.LaMesa",
-    11: "11.Burton",
-    12: "12.Rockford",
-    13: "13.Alta",
-    14: "14.DelPerro",
-    15: "15.Davis",
-    16: "16.Harmony",
-    17: "17.Redwood",
-    18: "18.Hawick",
-    19: "19.Grapeseed",
-    20: "20.Murrieta",
-    21: "21.Vespucci",
-    22: "22.Milton",
-    23: "23.LaPuerta"  # NEW: 23rd server
-}
+# Index = server_id (1..23); slot 0 is unused
+SERVER_NAMES = (
+    None,
+    "01.Downtown",
+    "02.Strawberry",
+    "03.Vinewood",
+    "04.Blackberry",
+    "05.Insquad",
+    "06.Sunrise",
+    "07.Rainbow",
+    "08.Richman",
+    "09.Eclipse",
+    "10.LaMesa",
+    "11.Burton",
+    "12.Rockford",
+    "13.Alta",
+    "14.DelPerro",
+    "15.Davis",
+    "16.Harmony",
+    "17.Redwood",
+    "18.Hawick",
+    "19.Grapeseed",
+    "20.Murrieta",
+    "21.Vespucci",
+    "22.Milton",
+    "23.LaPuerta",
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     is_online: bool
     name: str
@@ -65,19 +68,24 @@ class Profile:
 
 
 def from_dict(data: dict, server_name: str) -> Profile:
-    # Remove unnecessary fields
-    keys_to_remove = ["age", "id", "sex", "fraction", "fraction_rank", "fraction_rank_name", "friends",
-                      "skills", "is_vehicle_view_needed", "business"]
-    for key in keys_to_remove:
-        data.pop(key, None)
-
-    # Convert to boolean
-    data["house"] = bool(data.get("house"))
-    data["apartment"] = bool(data.get("apartment"))
-    data["vehicles"] = bool(data.get("vehicles"))
-
-    data["server"] = server_name
-    return Profile(**data)
+    # Only the fields we need are read; everything else in the payload is ignored
+    return Profile(
+        is_online=data["is_online"],
+        name=data["name"],
+        server=server_name,
+        lvl=data["lvl"],
+        exp=data["exp"],
+        max_exp=data["max_exp"],
+        cash=data["cash"],
+        bank=data["bank"],
+        house=bool(data.get("house")),
+        apartment=bool(data.get("apartment")),
+        vehicles=bool(data.get("vehicles")),
+        hours_played=data["hours_played"],
+        vip_level=data["vip_level"],
+        vip_name=data["vip_name"],
+        vip_expire_at=data["vip_expire_at"],
+    )
 
 
 def api_login(login: str, password: str) -> Optional[str]:
@@ -103,7 +111,7 @@ def api_login(login: str, password: str) -> Optional[str]:
                 return None
             
             # Check for empty response
-            if not response.text or response.text.strip() == "":
+            if not response.content.strip():
                 print(f"[Attempt {attempt}/{MAX_RETRIES}] Empty response from API", flush=True)
                 if attempt < MAX_RETRIES:
                     time.sleep(RETRY_DELAY)
@@ -112,7 +120,7 @@ def api_login(login: str, password: str) -> Optional[str]:
             
             # Parse JSON
             try:
-                account = json.loads(response.text)
+                account = _loads(response.content)
             except json.JSONDecodeError as e:
                 print(f"[Attempt {attempt}/{MAX_RETRIES}] JSON error: {e}", flush=True)
                 print(f"Response: {response.text[:100]}...", flush=True)
@@ -175,12 +183,12 @@ def get_profiles(login: str, password: str) -> List[Profile]:
                 continue
             
             # Skip empty responses
-            if not response.text or response.text.strip() in ("", "[]", "null"):
+            if response.content.strip() in (b"", b"[]", b"null"):
                 continue
             
             # Parse JSON
             try:
-                json_data = json.loads(response.text)
+                json_data = _loads(response.content)
             except json.JSONDecodeError:
                 continue
             
@@ -189,9 +197,10 @@ def get_profiles(login: str, password: str) -> List[Profile]:
                 continue
             
             # Parse profiles
+            server_name = SERVER_NAMES[server_id] if server_id < len(SERVER_NAMES) else f"Server{server_id}"
             for data in json_data:
                 try:
-                    profile = from_dict(data.copy(), server_names.get(server_id, f"Server{server_id}"))
+                    profile = from_dict(data, server_name)
                     profiles.append(profile)
                 except Exception as e:
                     print(f"Error parsing profile on server {server_id}: {e}", flush=True)
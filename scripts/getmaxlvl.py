@@ -1,22 +1,11 @@
-import subprocess
 import sys
 
-try:
-    import gspread
-    import requests
-    from google.oauth2.service_account import Credentials  # Пример библиотеки
-except ImportError:
-    print("Некоторые библиотеки не установлены. Устанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-except ValueError:
-    print("Некорректно установленные библиотеки. Переустанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "uninstall", "-r", "requirements.txt"])
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+import gspread
+from google.oauth2.service_account import Credentials
 
 
 def main(pc_name):
     # Авторизация
-    name = sys.argv[1]
     SCOPE = ["https://spreadsheets.google.com/feeds",
              "https://www.googleapis.com/auth/drive"]
     creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPE)
@@ -25,19 +14,22 @@ def main(pc_name):
     # Открываем таблицу и лист "Общая"
     sheet = client.open("Учет виртов").worksheet("Total")
 
-    # Получаем все значения из колонки A
-    column_a = sheet.col_values(1)
+    # Колонки A (PC NAME) и T (макс. уровень) одним запросом
+    column_a, column_t = sheet.batch_get(["A:A", "T:T"])
+    names = [row[0] if row else "" for row in column_a]
 
     # Ищем индекс строки с pc_name
     try:
-        row_index = column_a.index(pc_name) + 1  # +1 потому что индексы начинаются с 0
-        value_b = sheet.cell(row_index, 20).value  # Колонка B — это вторая колонка
-        if value_b is None:
-            print("5", flush=True)
-        else:
-            print(value_b, flush=True)
+        row_index = names.index(pc_name)
     except ValueError:
         print("")
+        return
+
+    row = column_t[row_index] if row_index < len(column_t) else []
+    if row and row[0]:
+        print(row[0], flush=True)
+    else:
+        print("5", flush=True)
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -1,5 +1,5 @@
+import functools
 import json
-import subprocess
 from datetime import datetime
 from dataclasses import dataclass
 from typing import List
@@ -7,51 +7,49 @@ import sys
 import time
 import math
 
-try:
-    import gspread
-    import requests
-    from google.oauth2.service_account import Credentials
-except ImportError:
-    print("Некоторые библиотеки не установлены. Устанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    import gspread
-    import requests
-    from google.oauth2.service_account import Credentials
-except ValueError:
-    print("Некорректно установленные библиотеки. Переустанавливаю...", flush=True)
-    subprocess.check_call([sys.executable, "-m", "pip", "uninstall", "-r", "requirements.txt"])
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-    import gspread
-    import requests
-    from google.oauth2.service_account import Credentials
-
-server_names = {
-    1: "01.Downtown",
-    2: "02.Strawberry",
-    3: "03.Vinewood",
-    4: "04.Blackberry",
-    5: "05.Insquad",
-    6: "06.Sunrise",
-    7: "07.Rainbow",
-    8: "08.Richman",
-    9: "09.Eclipse",
-    10: "10.LaMesa",
-    11: "11.Burton",
-    12: "12.Rockford",
-    13: "13.Alta",
-    14: "14.DelPerro",
-    15: "15.Davis",
-    16: "16.Harmony",
-    17: "17.Redwood",
-    18: "18.Hawick",
-    19: "19.Grapeseed",
-    20: "20.Murrieta",
-    21: "21.Vespucci",
-    22: "22.Milton"
-}
+import gspread
+import requests
+from google.oauth2.service_account import Credentials
 
+# Одна сессия на процесс: keep-alive к gta5rp.com для логина и 22 запросов персонажей
+SESSION = requests.Session()
 
-@dataclass
+# orjson парсит bytes напрямую, без декодирования response.text
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Индекс = server_id (1..22), 0 не используется
+SERVER_NAMES = (
+    None,
+    "01.Downtown",
+    "02.Strawberry",
+    "03.Vinewood",
+    "04.Blackberry",
+    "05.Insquad",
+    "06.Sunrise",
+    "07.Rainbow",
+    "08.Richman",
+    "09.Eclipse",
+    "10.LaMesa",
+    "11.Burton",
+    "12.Rockford",
+    "13.Alta",
+    "14.DelPerro",
+    "15.Davis",
+    "16.Harmony",
+    "17.Redwood",
+    "18.Hawick",
+    "19.Grapeseed",
+    "20.Murrieta",
+    "21.Vespucci",
+    "22.Milton",
+)
+
+
+@dataclass(slots=True)
 class Profile:
     name: str
     server: str
@@ -84,20 +82,24 @@ class User:
 
 
 def from_dict(data: dict, server_name: str) -> Profile:
-    # Удаляем ненужные поля
-    keys_to_remove = ["age", "id", "is_online", "sex", "fraction", "fraction_rank", "fraction_rank_name", "friends",
-                      "skills",
-                      "is_vehicle_view_needed", "business"]
-    for key in keys_to_remove:
-        data.pop(key, None)
-
-    # Делаем house, apartment, vehicles булевыми
-    data["house"] = bool(data["house"])
-    data["apartment"] = bool(data["apartment"])
-    data["vehicles"] = bool(data["vehicles"])  # True, если есть машины, иначе False
-
-    data["server"] = server_name
-    return Profile(**data)
+    # Берём только нужные поля, остальное из ответа API игнорируется
+    return Profile(
+        name=data["name"],
+        server=server_name,
+        lvl=data["lvl"],
+        exp=data["exp"],
+        max_exp=data["max_exp"],
+        cash=data["cash"],
+        bank=data["bank"],
+        # Делаем house, apartment, vehicles булевыми
+        house=bool(data["house"]),
+        apartment=bool(data["apartment"]),
+        vehicles=bool(data["vehicles"]),  # True, если есть машины, иначе False
+        hours_played=data["hours_played"],
+        vip_level=data["vip_level"],
+        vip_name=data["vip_name"],
+        vip_expire_at=data["vip_expire_at"],
+    )
 
 
 def check_int(s):
@@ -109,15 +111,20 @@ def check_int(s):
         return False
 
 
-def send_to_google_sheet(row_name, value, col, mode):
-    # Настройка доступа
-    SCOPE = ["https://spreadsheets.google.com/feeds",
-             "https://www.googleapis.com/auth/drive"]
+SCOPE = ["https://spreadsheets.google.com/feeds",
+         "https://www.googleapis.com/auth/drive"]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sheet():
+    """Авторизация и открытие листа "Total" (один раз за процесс)"""
     creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPE)
     client = gspread.authorize(creds)
+    return client.open("Учет виртов").worksheet("Total")
 
-    # Открываем таблицу и лист "Общая"
-    sheet = client.open("Учет виртов").worksheet("Total")
+
+def send_to_google_sheet(row_name, value, col, mode):
+    sheet = _get_sheet()
 
     # Получаем все данные из столбца А и состояния
     column_a = sheet.col_values(1)  # PC NAME
@@ -152,21 +159,26 @@ def send_to_google_sheet(row_name, value, col, mode):
     print("Account wasn't founded or all matches are 'Не основа'", flush=True)
 
 
+@functools.lru_cache(maxsize=8)
+def _login(login, password):
+    """Логин в GTA5RP, возвращает токен (кэшируется на время процесса).
+
+    Ошибки пробрасываются исключением, поэтому неудачный логин не кэшируется.
+    """
+    url = "https://gta5rp.com/api/V2/users/auth/login"
+    payload = {"login": login, "password": password, "remember": "0"}
+    response = SESSION.post(url, json=payload, timeout=10)
+    response.raise_for_status()
+    account = _loads(response.content)
+    if "token" not in account:
+        raise KeyError("'token' key missing in API response")
+    return account["token"]
+
+
 def get_profiles(login, password):
     # Login
-    url = "https://gta5rp.com/api/V2/users/auth/login"
-    payload = "{\"login\": \"" + login + "\", \"password\": \"" + password + "\", \"remember\": \"0\"}"
-    headers = {
-        'content-type': "application/json"
-    }
     try:
-        response = requests.request("POST", url, data=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        account = json.loads(response.text)
-        if "token" not in account:
-            print("Error: 'token' key missing in API response")
-            return []
-        token = account["token"]
+        SESSION.headers["x-access-token"] = _login(login, password)
     except (requests.exceptions.RequestException, json.JSONDecodeError, KeyError) as e:
         print(f"Error in get_profiles API: {e}")
         return []
@@ -175,38 +187,26 @@ def get_profiles(login, password):
     # Getting profiles
     for x in range(1, 23):
         url = "https://gta5rp.com/api/V2/users/chars/" + str(x)
-        headers = {
-            'x-access-token': token
-        }
-        response = requests.request("GET", url, headers=headers)
-        json_data = json.loads(response.text)
-        profiles.extend(from_dict(data, server_names.get(x)) for data in json_data)
+        response = SESSION.get(url)
+        if not response.ok:
+            continue
+        json_data = _loads(response.content)
+        profiles.extend(from_dict(data, SERVER_NAMES[x]) for data in json_data)
     return profiles
 
 
 def get_user(login, password):
-    url = "https://gta5rp.com/api/V2/users/auth/login"
-    payload = "{\"login\": \"" + login + "\", \"password\": \"" + password + "\", \"remember\": \"0\"}"
-    headers = {
-        'content-type': "application/json"
-    }
     try:
-        response = requests.request("POST", url, data=payload, headers=headers, timeout=10)
-        response.raise_for_status()
-        account = json.loads(response.text)
-        if "token" not in account:
-            print("Error: 'token' key missing in API response")
-            return None
-        token = account["token"]
+        SESSION.headers["x-access-token"] = _login(login, password)
     except (requests.exceptions.RequestException, json.JSONDecodeError, KeyError) as e:
         print(f"Error in get_user API: {e}")
         return None
     url = "https://gta5rp.com/api/V2/users/"
-    headers = {
-        'x-access-token': token
-    }
-    response = requests.request("GET", url, headers=headers)
-    json_data = json.loads(response.text)
+    response = SESSION.get(url)
+    if not response.ok:
+        print(f"Error in get_user API: HTTP {response.status_code}")
+        return None
+    json_data = _loads(response.content)
     return User(**json_data)
 
 
@@ -220,19 +220,17 @@ if __name__ == "__main__":
 
     if len(sys.argv) == 2:
         name = sys.argv[1]
-        SCOPE = ["https://spreadsheets.google.com/feeds",
-                 "https://www.googleapis.com/auth/drive"]
-        creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPE)
-        client = gspread.authorize(creds)
-
-        # Открываем таблицу и лист "Общая"
-        sheet = client.open("Учет виртов").worksheet("Total")
+        sheet = _get_sheet()
         pc_name = sheet.col_values(1)
         block = sheet.col_values(15)
         ban = sheet.col_values(16)
+        # Ячейка заполнена, если в ней есть что-то кроме пробелов и табов
+        block_has = [bool(s.strip(" \t")) for s in block]
+        ban_has = [bool(s.strip(" \t")) for s in ban]
         for row_index, pc in enumerate(pc_name, start = 1):
             if pc == name:
-                if (len(block) >= row_index and block[row_index - 1].replace(" ", "").replace("\t", "") != "") or (len(ban) >= row_index and ban[row_index - 1].replace(" ", "").replace("\t", "") != ""):
+                i = row_index - 1
+                if (i < len(block_has) and block_has[i]) or (i < len(ban_has) and ban_has[i]):
                     print("|",block[row_index - 1],"|")
                     print("|",ban[row_index - 1],"|")
                     print("1", flush=True)
@@ -244,13 +242,7 @@ if __name__ == "__main__":
         password = sys.argv[2]
         profiles = get_profiles(login, password)
         print("Profiles:\t", flush=True)
-        SCOPE = ["https://spreadsheets.google.com/feeds",
-                 "https://www.googleapis.com/auth/drive"]
-        creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPE)
-        client = gspread.authorize(creds)
-
-        # Открываем таблицу и лист "Общая"
-        sheet = client.open("Учет виртов").worksheet("Total")
+        sheet = _get_sheet()
 
         # Получаем все данные из столбца А и состояния
         server = sheet.col_values(2)  # Server
@@ -259,40 +251,49 @@ if __name__ == "__main__":
         vipDuration = sheet.col_values(5)  # Vip duration
         money = sheet.col_values(7)  # Money
         flat = sheet.col_values(11)  # House
+        # Индекс строк по (сервер, имя) — один проход по таблице вместо profiles × rows
+        # IndexError protection: только строки, где заполнены все нужные колонки
+        rows_by_key = {}
+        for i in range(min(len(server), len(profile_name), len(vipType), len(vipDuration))):
+            key = (server[i], profile_name[i].replace(" ", "_"))
+            rows_by_key.setdefault(key, []).append(i + 1)
+
         for profile in profiles:
-            for row_index, server_name in enumerate(server, start=1):
-                # IndexError protection
-                if row_index > len(profile_name) or row_index > len(vipType) or row_index > len(vipDuration):
-                    continue
-                if server_name == profile.server and profile_name[row_index - 1].replace(" ","_") == profile.name:
-                    print(f"Found in table, row #{row_index}", flush=True)
-                    if vipType[row_index - 1] != "Не основа":
-                        if profile.vip_level == 1:
-                            sheet.update_cell(row_index, 4, "Standart")
-                        elif profile.vip_level == 2:
-                            sheet.update_cell(row_index, 4, "Gold")
-                        elif profile.vip_level == 3:
-                            sheet.update_cell(row_index, 4, "Platinum")
-                        sheet.update_cell(row_index, 5, math.ceil((profile.vip_expire_at - time.time()) / 86400))
-                    sheet.update_cell(row_index, 7, profile.cash+profile.bank)
-                    if profile.house or profile.apartment:
-                        sheet.update_cell(row_index, 11, "Квартира")
-                    else:
-                        sheet.update_cell(row_index, 11, "")
-            print("Server:\t\t" + profile.server, flush=True)
-            print("Name:\t\t" + profile.name, flush=True)
-            print("Lvl:\t\t" + str(profile.lvl), flush=True)
-            print("Exp:\t\t" + str(profile.exp), flush=True)
-            print("ExpM:\t\t" + str(profile.max_exp), flush=True)
-            print("Cash:\t\t" + str(profile.cash), flush=True)
-            print("Bank:\t\t" + str(profile.bank), flush=True)
-            print("House:\t\tYES" if profile.house else "House:\t\tNO", flush=True)
-            print("Apartment:\tYES" if profile.apartment else "Apartment:\tNO", flush=True)
-            print("Vehicles:\tYES" if profile.vehicles else "Vehicles:\tNO", flush=True)
-            print("Hours played:\t" + str(profile.hours_played), flush=True)
-            print("Vip lvl:\t" + str(profile.vip_level), flush=True)
-            print("Vip type:\t" + profile.vip_name, flush=True)
-            print("Vip duration:\t" + str(round((profile.vip_expire_at - time.time()) / 86400)) + " days\n", flush=True)
+            for row_index in rows_by_key.get((profile.server, profile.name), ()):
+                print(f"Found in table, row #{row_index}", flush=True)
+                if vipType[row_index - 1] != "Не основа":
+                    if profile.vip_level == 1:
+                        sheet.update_cell(row_index, 4, "Standart")
+                    elif profile.vip_level == 2:
+                        sheet.update_cell(row_index, 4, "Gold")
+                    elif profile.vip_level == 3:
+                        sheet.update_cell(row_index, 4, "Platinum")
+                    sheet.update_cell(row_index, 5, math.ceil((profile.vip_expire_at - time.time()) / 86400))
+                sheet.update_cell(row_index, 7, profile.cash+profile.bank)
+                if profile.house or profile.apartment:
+                    sheet.update_cell(row_index, 11, "Квартира")
+                else:
+                    sheet.update_cell(row_index, 11, "")
+            # Отчёт по профилю одним write вместо 14 print(flush=True)
+            vip_days = round((profile.vip_expire_at - time.time()) / 86400)
+            lines = [
+                f"Server:\t\t{profile.server}",
+                f"Name:\t\t{profile.name}",
+                f"Lvl:\t\t{profile.lvl}",
+                f"Exp:\t\t{profile.exp}",
+                f"ExpM:\t\t{profile.max_exp}",
+                f"Cash:\t\t{profile.cash}",
+                f"Bank:\t\t{profile.bank}",
+                "House:\t\tYES" if profile.house else "House:\t\tNO",
+                "Apartment:\tYES" if profile.apartment else "Apartment:\tNO",
+                "Vehicles:\tYES" if profile.vehicles else "Vehicles:\tNO",
+                f"Hours played:\t{profile.hours_played}",
+                f"Vip lvl:\t{profile.vip_level}",
+                f"Vip type:\t{profile.vip_name}",
+                f"Vip duration:\t{vip_days} days",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n\n")
+        sys.stdout.flush()
 
     elif len(sys.argv) == 4:
         login = sys.argv[1]
@@ -300,13 +301,7 @@ if __name__ == "__main__":
         row_name = sys.argv[3]
         user = get_user(login,password)
         if user is not None and user.balance > 0:
-            SCOPE = ["https://spreadsheets.google.com/feeds",
-                     "https://www.googleapis.com/auth/drive"]
-            creds = Credentials.from_service_account_file("credentials.json", scopes=SCOPE)
-            client = gspread.authorize(creds)
-
-            # Открываем таблицу и лист "Общая"
-            sheet = client.open("Учет виртов").worksheet("Total")
+            sheet = _get_sheet()
 
             # Получаем все данные из столбца А и состояния
             column_a = sheet.col_values(1)  # PCNAME
@@ -14,35 +14,193 @@ Returns:
 """
 
 import ctypes
+import functools
+import operator
+import os
+import random
+import re
+import socket
+import struct
 import sys
 import time
-import re
 import json
-import ssl
-import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, TimeoutError as FuturesTimeout
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
 from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import urllib3
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import create_connection
+
+# orjson парсит bytes напрямую и быстрее; без него — json.loads, он тоже принимает bytes
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Добавляем parent в path для импорта
 sys.path.insert(0, str(__file__).rsplit('scripts', 1)[0])
 try:
     from utils import get_logger
+    from config import DATA_DIR
     logger = get_logger()
 except ImportError:
     import logging
     logger = logging.getLogger(__name__)
+    DATA_DIR = Path.home()
+
+# Последний источник, ответивший успешно — пробуем его первым
+LAST_SOURCE_FILE = DATA_DIR / "time_sync_last_source.txt"
 
 # Moscow timezone offset (UTC+3)
 MOSCOW_OFFSET = timedelta(hours=3)
+_MSK_TZ = timezone(MOSCOW_OFFSET)
+
+# "datetime" (WorldTimeAPI) / "dateTime" (TimeAPI.io) в начале JSON-ответа
+_DT_RE = re.compile(rb'"datetime"\s*:\s*"([^"]+)"', re.IGNORECASE)
+
+# TimeAPI.io: поля ответа в порядке аргументов datetime()
+_TIMEAPI_FIELDS = operator.itemgetter("year", "month", "day", "hour", "minute", "seconds")
 
 # Configuration
 MAX_GLOBAL_RETRIES = 2  # Reduced from 10 to 2 for speed
 RETRY_DELAY = 1  # Reduced from 3 to 1 for speed
-CYCLE_DELAY = 10  # Delay between full cycles
-REQUEST_TIMEOUT = 15  # HTTP request timeout
+CYCLE_DELAY = 10  # Max delay between full cycles (full-jitter backoff)
+REQUEST_TIMEOUT = 15  # Overall deadline for one round of sources
+CONNECT_TIMEOUT = 2  # TCP/TLS connect timeout per request
+READ_TIMEOUT = 5  # Read timeout per request (HEAD sources)
+BREAKER_THRESHOLD = 2  # Failures in a row before a source is skipped
+BREAKER_COOLDOWN = 30  # Seconds a failed source is skipped
+BREAKER_PERMANENT_COOLDOWN = 600  # Seconds a source answering 4xx is skipped
+DNS_TTL = 600  # Seconds a resolved time-source hostname is reused
+LAST_SOURCE_HEAD_START = 1  # Seconds the last good source runs alone before the others start
+TOLERANCE_SEC = 2  # Clock drift below this is left alone (Date header has 1s resolution)
+
+# Общий пул соединений: keep-alive между источниками, ретраями и циклами
+_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=4,
+    timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT, read=READ_TIMEOUT),
+    retries=False,
+    headers={'User-Agent': 'Mozilla/5.0'},
+)
+
+# JSON API отвечают медленнее, чем HEAD к CDN — даём им больше времени
+JSON_TIMEOUT = urllib3.Timeout(connect=3, read=8)
+
+
+class PermanentSourceError(Exception):
+    """Source answered with a client error (4xx except 429): retrying won't help"""
+
+
+def _status_ok(response) -> bool:
+    """True для 200; 4xx (кроме 429) — PermanentSourceError; 5xx/429 — False (можно повторить)"""
+    if response.status == 200:
+        return True
+    if 400 <= response.status < 500 and response.status != 429:
+        raise PermanentSourceError(f"HTTP {response.status}")
+    return False
+
+
+# ============================================================================
+# DNS CACHE - resolve time-source hosts once, not on every request
+# Используется только соединениями _POOL; socket.getaddrinfo процесса не трогаем
+# ============================================================================
+
+_DNS_HOSTS = frozenset({
+    "worldtimeapi.org",
+    "timeapi.io",
+    "www.yandex.ru",
+    "www.google.com",
+    "www.cloudflare.com",
+    "github.com",
+})
+
+# (host, port, *args) -> (expires monotonic, getaddrinfo result)
+_DNS_CACHE = {}
+_dns_prefetch_started = False
+
+
+def _cached_getaddrinfo(host, port, *args):
+    """socket.getaddrinfo с кэшем на DNS_TTL секунд"""
+    key = (host, port) + args
+    cached = _DNS_CACHE.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    # Ошибки не кэшируем: следующая попытка снова пойдёт в резолвер
+    result = socket.getaddrinfo(host, port, *args)
+    _DNS_CACHE[key] = (time.monotonic() + DNS_TTL, result)
+    return result
+
+
+def _preresolve_hosts() -> None:
+    """Прогреть кэш в фоне, пока вызывающий код проверяет права и т.п."""
+    for host in _DNS_HOSTS:
+        for port in (80, 443):
+            try:
+                _cached_getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+            except OSError:
+                pass
+
+
+def _start_dns_prefetch() -> None:
+    """Запустить прогрев кэша один раз — при первом sync_time(), не при импорте"""
+    global _dns_prefetch_started
+    if _dns_prefetch_started:
+        return
+    _dns_prefetch_started = True
+    threading.Thread(target=_preresolve_hosts, name="time-dns", daemon=True).start()
+
+
+class _CachedDNSMixin:
+    """Соединение с хостом источника по адресу из _DNS_CACHE.
+    
+    Меняется только адрес для connect(); host (заголовок Host, SNI,
+    проверка сертификата) остаётся прежним.
+    """
+    
+    def _new_conn(self):
+        if self.host not in _DNS_HOSTS:
+            return super()._new_conn()
+        key = (self.host, self.port, 0, socket.SOCK_STREAM)
+        err = None
+        for *_, sockaddr in _cached_getaddrinfo(*key):
+            try:
+                return create_connection(
+                    sockaddr[:2],
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+            except OSError as e:
+                err = e
+        # Ни один адрес не ответил — возможно, запись устарела: перерезолвим в следующий раз
+        _DNS_CACHE.pop(key, None)
+        raise err
+
+
+class _CachedDNSHTTPConnection(_CachedDNSMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+_POOL.pool_classes_by_scheme = {"http": _CachedDNSHTTPPool, "https": _CachedDNSHTTPSPool}
 
 
 def is_admin() -> bool:
@@ -53,46 +211,47 @@ def is_admin() -> bool:
         return False
 
 
-class SYSTEMTIME(ctypes.Structure):
-    """Windows SYSTEMTIME structure for SetLocalTime API"""
-    _fields_ = [
-        ("wYear", ctypes.c_ushort),
-        ("wMonth", ctypes.c_ushort),
-        ("wDayOfWeek", ctypes.c_ushort),
-        ("wDay", ctypes.c_ushort),
-        ("wHour", ctypes.c_ushort),
-        ("wMinute", ctypes.c_ushort),
-        ("wSecond", ctypes.c_ushort),
-        ("wMilliseconds", ctypes.c_ushort),
-    ]
-
-
 # ============================================================================
 # TIME SOURCES - Multiple fallback options
 # ============================================================================
 
+def _fetch_json_time(url: str, from_json) -> Optional[datetime]:
+    """GET a JSON time API and extract its datetime field.
+
+    Only the first 512 bytes are searched for the field; the full body is
+    decoded with json (and handed to from_json) only when that misses.
+    """
+    response = _POOL.request('GET', url, timeout=JSON_TIMEOUT, preload_content=False)
+    try:
+        if not _status_ok(response):
+            return None
+        head = response.read(512)
+        match = _DT_RE.search(head)
+        if match:
+            # "2025-06-19T14:30:00.123456+03:00" -> naive "2025-06-19T14:30:00"
+            return datetime.fromisoformat(match.group(1)[:19].decode())
+        return from_json(_loads(head + response.read()))
+    finally:
+        # Дочитываем остаток, чтобы соединение вернулось в пул для keep-alive
+        response.drain_conn()
+        response.release_conn()
+
+
 def get_time_worldtimeapi() -> Optional[datetime]:
     """WorldTimeAPI - Primary source"""
-    try:
-        urls = [
-            "http://worldtimeapi.org/api/timezone/Europe/Moscow",
-            "https://worldtimeapi.org/api/timezone/Europe/Moscow",
-        ]
-        for url in urls:
-            try:
-                req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-                    data = json.loads(response.read().decode())
-                    dt_str = data.get("datetime", "")
-                    # Parse: "2025-06-19T14:30:00.123456+03:00"
-                    match = re.match(r"(\d+)-(\d+)-(\d+)T(\d+):(\d+):(\d+)", dt_str)
-                    if match:
-                        y, m, d, h, mi, s = map(int, match.groups())
-                        return datetime(y, m, d, h, mi, s)
-            except:
-                continue
-    except:
-        pass
+    urls = [
+        "http://worldtimeapi.org/api/timezone/Europe/Moscow",
+        "https://worldtimeapi.org/api/timezone/Europe/Moscow",
+    ]
+    for url in urls:
+        try:
+            dt = _fetch_json_time(url, lambda data: datetime.fromisoformat(data["datetime"][:19]))
+            if dt:
+                return dt
+        except PermanentSourceError:
+            raise
+        except:
+            continue
     return None
 
 
@@ -100,102 +259,270 @@ def get_time_timeapi_io() -> Optional[datetime]:
     """TimeAPI.io - Alternative API"""
     try:
         url = "https://timeapi.io/api/Time/current/zone?timeZone=Europe/Moscow"
-        req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-            data = json.loads(response.read().decode())
-            return datetime(
-                data["year"], data["month"], data["day"],
-                data["hour"], data["minute"], data["seconds"]
-            )
+        return _fetch_json_time(url, lambda data: datetime(*_TIMEAPI_FIELDS(data)))
+    except PermanentSourceError:
+        raise
     except:
         return None
 
 
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def parse_http_date(value: str) -> datetime:
+    """Parse an HTTP Date header into a naive Moscow-time datetime.
+
+    Fast path for the fixed-width IMF-fixdate format every modern server sends
+    ("Sun, 06 Nov 1994 08:49:37 GMT"): the value is GMT, so the offset is
+    simply added to a naive datetime. Anything else goes through the full
+    RFC 2822 parser.
+    """
+    if len(value) == 29 and value.endswith(" GMT"):
+        month = _MONTHS.get(value[8:11])
+        if month:
+            return datetime(
+                int(value[12:16]), month, int(value[5:7]),
+                int(value[17:19]), int(value[20:22]), int(value[23:25]),
+            ) + MOSCOW_OFFSET
+    return parsedate_to_datetime(value).astimezone(_MSK_TZ).replace(tzinfo=None)
+
+
 def get_time_from_http_headers(url: str) -> Optional[datetime]:
     """Extract time from HTTP Date header (works with any website)"""
     try:
-        req = Request(url, headers={'User-Agent': 'Mozilla/5.0'}, method='HEAD')
-        with urlopen(req, timeout=REQUEST_TIMEOUT) as response:
-            date_header = response.headers.get('Date')
-            if date_header:
-                # Parse RFC 2822 date and convert to Moscow time
-                dt = parsedate_to_datetime(date_header)
-                moscow_dt = dt.astimezone(timezone(MOSCOW_OFFSET)).replace(tzinfo=None)
-                return moscow_dt
+        # Редиректы не нужны: Date есть и в ответе 3xx
+        response = _POOL.request('HEAD', url, redirect=False)
+        date_header = response.headers.get('Date')
+        if date_header:
+            # Parse HTTP date straight to Moscow time
+            return parse_http_date(date_header)
     except:
         pass
     return None
 
 
-def get_time_google() -> Optional[datetime]:
-    return get_time_from_http_headers("https://www.google.com")
-
-def get_time_yandex() -> Optional[datetime]:
-    return get_time_from_http_headers("https://www.yandex.ru")
-
-def get_time_cloudflare() -> Optional[datetime]:
-    return get_time_from_http_headers("https://www.cloudflare.com")
-
-def get_time_github() -> Optional[datetime]:
-    return get_time_from_http_headers("https://github.com")
+# Сайты, с которых берём только заголовок Date
+_HEADER_SOURCES = (
+    ("Yandex", "https://www.yandex.ru"),
+    ("Google", "https://www.google.com"),
+    ("Cloudflare", "https://www.cloudflare.com"),
+    ("GitHub", "https://github.com"),
+)
 
+# Быстрый CDN для проверки, нужна ли синхронизация вообще
+CLOCK_CHECK_URL = "https://www.cloudflare.com"
 
 # All time sources in priority order
-TIME_SOURCES = [
+TIME_SOURCES = (
     ("WorldTimeAPI", get_time_worldtimeapi),
     ("TimeAPI.io", get_time_timeapi_io),
-    ("Yandex", get_time_yandex),
-    ("Google", get_time_google),
-    ("Cloudflare", get_time_cloudflare),
-    ("GitHub", get_time_github),
-]
+) + tuple(
+    (name, functools.partial(get_time_from_http_headers, url))
+    for name, url in _HEADER_SOURCES
+)
+
+# Пул потоков живёт весь процесс и переиспользуется между циклами sync_time
+_EXECUTOR = ThreadPoolExecutor(max_workers=len(TIME_SOURCES), thread_name_prefix="time-source")
+
+
+# ============================================================================
+# CIRCUIT BREAKER - skip sources that just failed
+# ============================================================================
+
+# name -> {"fails": int, "open_until": monotonic seconds}
+_BREAKER = {}
+_BREAKER_LOCK = threading.Lock()
+
+
+def _source_available(name: str) -> bool:
+    """CLOSED / HALF_OPEN: можно пробовать. OPEN: источник пропускаем"""
+    with _BREAKER_LOCK:
+        state = _BREAKER.get(name)
+        return state is None or state["open_until"] <= time.monotonic()
+
+
+def _record_result(name: str, ok: bool, permanent: bool = False) -> None:
+    """Обновить состояние источника после попытки"""
+    with _BREAKER_LOCK:
+        state = _BREAKER.setdefault(name, {"fails": 0, "open_until": 0.0})
+        if ok:
+            state["fails"] = 0
+            state["open_until"] = 0.0
+            return
+        state["fails"] += 1
+        if permanent:
+            # 4xx не исправится повтором — отключаем источник надолго сразу
+            state["open_until"] = time.monotonic() + BREAKER_PERMANENT_COOLDOWN
+        elif state["fails"] >= BREAKER_THRESHOLD:
+            state["open_until"] = time.monotonic() + BREAKER_COOLDOWN
 
 
 # ============================================================================
 # SYSTEM TIME SETTER
 # ============================================================================
 
-def set_system_time(dt: datetime) -> bool:
-    """Set Windows system time using SetLocalTime API"""
-    try:
-        st = SYSTEMTIME()
-        st.wYear = dt.year
-        st.wMonth = dt.month
-        st.wDay = dt.day
-        st.wHour = dt.hour
-        st.wMinute = dt.minute
-        st.wSecond = dt.second
-        st.wMilliseconds = 0
-        st.wDayOfWeek = 0  # Windows calculates this
-
-        result = ctypes.windll.kernel32.SetLocalTime(ctypes.byref(st))
-        if not result:
-            error = ctypes.get_last_error()
-            logger.error(f"SetLocalTime failed with error code: {error}")
+if sys.platform == 'win32':
+    class SYSTEMTIME(ctypes.Structure):
+        """Windows SYSTEMTIME structure for SetLocalTime API"""
+        _fields_ = [
+            ("wYear", ctypes.c_ushort),
+            ("wMonth", ctypes.c_ushort),
+            ("wDayOfWeek", ctypes.c_ushort),
+            ("wDay", ctypes.c_ushort),
+            ("wHour", ctypes.c_ushort),
+            ("wMinute", ctypes.c_ushort),
+            ("wSecond", ctypes.c_ushort),
+            ("wMilliseconds", ctypes.c_ushort),
+        ]
+
+    # kernel32 загружаем один раз; use_last_error — код ошибки через ctypes.get_last_error()
+    _k32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _SetLocalTime = _k32.SetLocalTime
+    _SetLocalTime.argtypes = [ctypes.POINTER(SYSTEMTIME)]
+    _SetLocalTime.restype = ctypes.c_int
+
+    # wYear, wMonth, wDayOfWeek, wDay, wHour, wMinute, wSecond, wMilliseconds
+    _SYSTEMTIME_LAYOUT = struct.Struct("<8H")
+
+    # Один буфер на процесс: SYSTEMTIME пакуется в него одним вызовом struct
+    _ST_BUF = (ctypes.c_ubyte * ctypes.sizeof(SYSTEMTIME))()
+    _ST_PTR = ctypes.cast(_ST_BUF, ctypes.POINTER(SYSTEMTIME))
+
+    def set_system_time(dt: datetime) -> bool:
+        """Set Windows system time using SetLocalTime API"""
+        try:
+            # wDayOfWeek = 0: Windows calculates this
+            _SYSTEMTIME_LAYOUT.pack_into(
+                _ST_BUF, 0,
+                dt.year, dt.month, 0, dt.day, dt.hour, dt.minute, dt.second, 0,
+            )
+            result = _SetLocalTime(_ST_PTR)
+            if not result:
+                error = ctypes.get_last_error()
+                logger.error(f"SetLocalTime failed with error code: {error}")
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set system time: {e}")
             return False
-        return True
+else:
+    def set_system_time(dt: datetime) -> bool:
+        """SetLocalTime есть только в Windows"""
+        raise NotImplementedError("set_system_time is only supported on Windows")
+
+
+# ============================================================================
+# LAST GOOD SOURCE
+# ============================================================================
+
+_last_source: Optional[str] = None
+
+
+def load_last_source() -> Optional[str]:
+    """Имя последнего успешного источника (из памяти или с диска)"""
+    global _last_source
+    if _last_source is None:
+        try:
+            _last_source = LAST_SOURCE_FILE.read_text(encoding="utf-8").strip()
+        except OSError:
+            _last_source = ""
+    return _last_source or None
+
+
+def save_last_source(name: str) -> None:
+    """Запомнить успешный источник (атомарно, через os.replace)"""
+    global _last_source
+    if name == _last_source:
+        return
+    _last_source = name
+    try:
+        tmp_path = LAST_SOURCE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(name, encoding="utf-8")
+        os.replace(tmp_path, LAST_SOURCE_FILE)
+    except OSError as e:
+        logger.debug(f"Failed to save last time source: {e}")
+
+
+def _query_source(name: str, func) -> Optional[datetime]:
+    """Вызвать источник и обновить его circuit breaker"""
+    try:
+        dt = func()
+    except PermanentSourceError as e:
+        logger.debug(f"{name}: {e}, disabling for {BREAKER_PERMANENT_COOLDOWN}s")
+        _record_result(name, False, permanent=True)
+        return None
     except Exception as e:
-        logger.error(f"Failed to set system time: {e}")
-        return False
+        logger.debug(f"{name}: {e}")
+        dt = None
+    _record_result(name, bool(dt))
+    if not dt:
+        logger.debug(f"{name} returned no data")
+    return dt
 
 
 def get_current_time_from_any_source() -> Optional[Tuple[str, datetime]]:
-    """Try all sources and return first successful result"""
-    for name, func in TIME_SOURCES:
-        try:
-            logger.info(f"Trying {name}...")
-            dt = func()
+    """Give the last good source a head start, then query the rest concurrently"""
+    sources = [(name, func) for name, func in TIME_SOURCES if _source_available(name)]
+    if not sources:
+        logger.warning("All sources are cooling down after failures")
+        return None
+
+    futures = {}
+    try:
+        # Обычно прошлый источник отвечает и сейчас — одного запроса хватает.
+        # Но ждём его не дольше LAST_SOURCE_HEAD_START: мёртвый хост не должен
+        # задерживать остальные на полный таймаут
+        last = load_last_source()
+        for name, func in sources:
+            if name == last:
+                logger.info(f"Trying last good source {name}...")
+                future = _EXECUTOR.submit(_query_source, name, func)
+                futures[future] = name
+                wait([future], timeout=LAST_SOURCE_HEAD_START)
+                if future.done() and future.result():
+                    dt = future.result()
+                    logger.info(f"Got time from {name}: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
+                    return (name, dt)
+                break
+
+        rest = [(name, func) for name, func in sources if name != last]
+        if rest:
+            logger.info(f"Querying {len(rest)} sources...")
+            futures.update({_EXECUTOR.submit(_query_source, name, func): name for name, func in rest})
+
+        # Прошлый источник остаётся в гонке, если ещё не ответил
+        for future in as_completed(futures, timeout=REQUEST_TIMEOUT + 2):
+            name = futures[future]
+            dt = future.result()
             if dt:
                 logger.info(f"Got time from {name}: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
+                save_last_source(name)
                 return (name, dt)
-            else:
-                logger.debug(f"{name} returned no data")
-        except Exception as e:
-            logger.debug(f"{name}: {e}")
-        time.sleep(0.5)  # Small delay between sources
+    except FuturesTimeout:
+        logger.debug("Timed out waiting for time sources")
+    finally:
+        # Не ждём медленные источники — первый ответ уже получен
+        for future in futures:
+            future.cancel()
     return None
 
 
+def clock_within_tolerance() -> bool:
+    """Один HEAD к Cloudflare: True, если локальные часы и так расходятся меньше чем на TOLERANCE_SEC"""
+    remote = get_time_from_http_headers(CLOCK_CHECK_URL)
+    if not remote:
+        return False
+    drift = (remote - datetime.now()).total_seconds()
+    if abs(drift) < TOLERANCE_SEC:
+        logger.info(f"✅ Clock OK (drift {drift:+.1f}s), no sync needed")
+        return True
+    logger.info(f"Clock drift {drift:+.1f}s, syncing...")
+    return False
+
+
 def sync_time() -> bool:
     """
     Синхронизировать системное время.
@@ -214,6 +541,13 @@ def sync_time() -> bool:
         logger.info("ℹ️  Time sync requires administrator privileges")
         return True  # Возвращаем True чтобы не блокировать startup
 
+    # Адреса источников резолвятся в фоне, пока идёт проверка часов
+    _start_dns_prefetch()
+
+    # Частый случай — часы уже точные: один запрос вместо полного цикла и SetLocalTime
+    if clock_within_tolerance():
+        return True
+
     for cycle in range(1, MAX_GLOBAL_RETRIES + 1):
         logger.info(f"Attempt {cycle}/{MAX_GLOBAL_RETRIES}...")
         
@@ -233,8 +567,10 @@ def sync_time() -> bool:
             logger.warning(f"All sources failed in attempt {cycle}")
         
         if cycle < MAX_GLOBAL_RETRIES:
-            logger.info(f"Waiting {CYCLE_DELAY}s before retry...")
-            time.sleep(CYCLE_DELAY)
+            # Full jitter: random(0, min(cap, 2^cycle))
+            delay = random.uniform(0, min(CYCLE_DELAY, 2 ** cycle))
+            logger.info(f"Waiting {delay:.1f}s before retry...")
+            time.sleep(delay)
     
     logger.error("❌ Failed to sync time after all attempts!")
     return False
@@ -10,24 +10,22 @@ OPTIMIZATIONS:
 - Auto re-login on 401 errors
 """
 
+import gzip
 import json
 import sys
 import time
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Dict, Any
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-try:
-    import requests
-except ImportError:
-    import subprocess
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
-    import requests
+import requests
 
+from config import settings
 from game.gta5rp_session import get_session, SERVER_NAMES
+from utils.fastjson import dumps as _dumps
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -36,6 +34,12 @@ logger = logging.getLogger(__name__)
 # GTA5RP API
 GTA5RP_API = "https://gta5rp.com/api/V2"
 
+# Keep-alive к нашему серверу между периодическими синхронизациями
+SESSION = requests.Session()
+
+# gzip только по SYNC_GZIP=1; если сервер не принял сжатое тело — дальше шлём как есть
+_gzip_accepted = settings.SYNC_GZIP
+
 # Server names mapping (now imported from gta5rp_session)
 # Kept here for backward compatibility if needed
 
@@ -49,12 +53,60 @@ GTA5RP_API = "https://gta5rp.com/api/V2"
 # Removed: get_all_characters() - now using get_characters_for_server() from session
 
 
-def get_online_character(characters: List[Dict]) -> Optional[Dict]:
-    """Find the currently online character"""
-    for char in characters:
-        if char.get("is_online"):
-            return char
-    return None
+def post_payload(url: str, payload: Dict[str, Any]) -> requests.Response:
+    """POST JSON payload, gzip-compressed if enabled and while the server accepts it"""
+    global _gzip_accepted
+    body = _dumps(payload)
+    if _gzip_accepted:
+        response = SESSION.post(
+            url,
+            data=gzip.compress(body, compresslevel=1),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            timeout=30
+        )
+        # Сервер, не понимающий Content-Encoding, видит битый JSON и может ответить
+        # чем угодно (400/415/422/500). Не откатываемся только на успех и ошибки авторизации
+        if response.status_code < 400 or response.status_code in (401, 403):
+            return response
+        logger.warning(f"Server rejected gzip body ({response.status_code}), sending uncompressed")
+        _gzip_accepted = False
+    return SESSION.post(
+        url,
+        data=body,
+        headers={"Content-Type": "application/json"},
+        timeout=30
+    )
+
+
+def build_char_data(char: Dict[str, Any]) -> Dict[str, Any]:
+    """Cleaned-up character entry for the sync payload"""
+    get = char.get
+    cash = get("cash", 0)
+    bank = get("bank", 0)
+    vehicles = get("vehicles") or []
+    return {
+        "char_id": get("id"),
+        "name": get("name"),
+        "server_id": get("server_id"),
+        "server_name": get("server_name"),
+        "is_online": bool(get("is_online")),
+        "lvl": get("lvl", 0),
+        "exp": get("exp", 0),
+        "max_exp": get("max_exp", 0),
+        "cash": cash,
+        "bank": bank,
+        "total_money": cash + bank,
+        "has_house": bool(get("house")),
+        "has_apartment": bool(get("apartment")),
+        "has_business": bool(get("business")),
+        "vehicles_count": len(vehicles),
+        "vehicles": vehicles,
+        "hours_played": get("hours_played", 0),
+        "vip_level": get("vip_level", 0),
+        "vip_name": get("vip_name", ""),
+        "vip_expire_at": get("vip_expire_at", 0),
+        "fraction": get("fraction", "-"),
+    }
 
 
 def sync_profile(login: str, password: str, server_api_url: str, machine_id: str, server_name: str = None) -> bool:
@@ -102,10 +154,11 @@ def sync_profile(login: str, password: str, server_api_url: str, machine_id: str
     
     logger.info(f"Found {len(characters)} characters on {server_name or 'all servers'}")
     
-    # Step 4: Find online character
-    online_char = get_online_character(characters)
+    # Step 4: Clean up character data and find the online one among it
+    chars_data = [build_char_data(char) for char in characters]
+    online_char = next((c for c in chars_data if c["is_online"]), None)
     if online_char:
-        logger.info(f"Online: {online_char.get('name')} on {online_char.get('server_name')}")
+        logger.info(f"Online: {online_char['name']} on {online_char['server_name']}")
     
     # Step 5: Build sync payload
     payload = {
@@ -118,44 +171,14 @@ def sync_profile(login: str, password: str, server_api_url: str, machine_id: str
             "total_donate": user_info.get("total_donate", 0),
             "last_server": user_info.get("last_server"),
         },
-        "characters": [],
-        "online_character": None
+        "characters": chars_data,
+        "online_character": online_char
     }
     
-    # Add character data (cleaned up)
-    for char in characters:
-        char_data = {
-            "char_id": char.get("id"),
-            "name": char.get("name"),
-            "server_id": char.get("server_id"),
-            "server_name": char.get("server_name"),
-            "is_online": bool(char.get("is_online")),
-            "lvl": char.get("lvl", 0),
-            "exp": char.get("exp", 0),
-            "max_exp": char.get("max_exp", 0),
-            "cash": char.get("cash", 0),
-            "bank": char.get("bank", 0),
-            "total_money": char.get("cash", 0) + char.get("bank", 0),
-            "has_house": bool(char.get("house")),
-            "has_apartment": bool(char.get("apartment")),
-            "has_business": bool(char.get("business")),
-            "vehicles_count": len(char.get("vehicles", []) or []),
-            "vehicles": char.get("vehicles", []),
-            "hours_played": char.get("hours_played", 0),
-            "vip_level": char.get("vip_level", 0),
-            "vip_name": char.get("vip_name", ""),
-            "vip_expire_at": char.get("vip_expire_at", 0),
-            "fraction": char.get("fraction", "-"),
-        }
-        payload["characters"].append(char_data)
-        
-        if char.get("is_online"):
-            payload["online_character"] = char_data
-    
     # Step 6: Send to our server
     try:
         url = f"{server_api_url}/api/profiles/sync"
-        response = requests.post(url, json=payload, timeout=30)
+        response = post_payload(url, payload)
         
         if response.status_code == 200:
             logger.info(f"✓ Profile synced successfully")
@@ -11,6 +11,7 @@ Returns:
 
 from __future__ import annotations
 
+import html
 import os
 import re
 import subprocess
@@ -119,9 +120,64 @@ def default_target_path() -> Path:
     return Path.cwd() / "settings.xml"
 
 
-def get_gpu_name() -> Optional[str]:
-    """Detect GPU name via PowerShell"""
-    ps = r"""
+# Видеокарта за время жизни машины не меняется — кэшируем, чтобы не запускать PowerShell
+GPU_CACHE_PATH = Path(tempfile.gettempdir()) / "gpu_name.cache"
+GPU_CACHE_TTL = 30 * 86400  # seconds
+
+
+def get_gpu_name(refresh: bool = False) -> Optional[str]:
+    """GPU name from the cache file, or detected and cached (refresh=True skips the cache)"""
+    if not refresh:
+        try:
+            if time.time() - GPU_CACHE_PATH.stat().st_mtime < GPU_CACHE_TTL:
+                name = GPU_CACHE_PATH.read_text(encoding="utf-8").strip()
+                if name:
+                    return name
+        except OSError:
+            pass
+
+    name = detect_gpu_name()
+    if name:
+        try:
+            GPU_CACHE_PATH.write_text(name, encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Failed to cache GPU name: {e}")
+    return name
+
+
+# Виртуальные/удалённые адаптеры — не настоящая видеокарта (как -notmatch в PowerShell)
+VIRTUAL_GPU_RE = re.compile(r"Basic|Parsec|Virtual|Remote|RDP|VMware|Hyper-V", re.IGNORECASE)
+
+
+def detect_gpu_name() -> Optional[str]:
+    """Detect GPU name via WMI, falling back to PowerShell"""
+    # WMI через COM в том же процессе (нужен pywin32); без него — PowerShell.
+    # Импорт здесь, а не в начале модуля: при ответе из кэша GPU pywin32 не грузим
+    try:
+        import pythoncom
+        import wmi
+    except ImportError:
+        return detect_gpu_name_powershell()
+
+    com_initialized = False
+    try:
+        # Поток сканера ScriptRunner COM сам не инициализирует
+        pythoncom.CoInitialize()
+        com_initialized = True
+        for controller in wmi.WMI().Win32_VideoController():
+            name = (controller.Name or "").strip()
+            if name and not VIRTUAL_GPU_RE.search(name):
+                return name
+        return None
+    except Exception as e:
+        logger.warning(f"WMI GPU query failed, using PowerShell: {e}")
+    finally:
+        if com_initialized:
+            pythoncom.CoUninitialize()
+    return detect_gpu_name_powershell()
+
+
+_PS_GPU_CMD = r"""
 $ErrorActionPreference = 'Stop'
 Get-CimInstance Win32_VideoController |
 Where-Object {
@@ -130,6 +186,9 @@ Where-Object {
 Select-Object -First 1 -ExpandProperty Name
 """.strip()
 
+
+def detect_gpu_name_powershell() -> Optional[str]:
+    """Detect GPU name via PowerShell"""
     try:
         completed = subprocess.run(
             [
@@ -138,7 +197,7 @@ Select-Object -First 1 -ExpandProperty Name
                 "-ExecutionPolicy",
                 "Bypass",
                 "-Command",
-                ps,
+                _PS_GPU_CMD,
             ],
             capture_output=True,
             text=True,
@@ -160,18 +219,44 @@ VIDEO_TAG_RE = re.compile(
 )
 
 
-def apply_videocard_description(template_text: str, gpu_name: str) -> str:
+def split_template(template_text: str) -> tuple[str, str]:
+    """Split a template around the <VideoCardDescription> value: (before, after)"""
     m = VIDEO_TAG_RE.search(template_text)
     if not m:
         raise ValueError("Template is missing <VideoCardDescription>")
 
     indent = m.group("indent") or ""
-    replacement_line = f"{indent}<VideoCardDescription>{gpu_name}</VideoCardDescription>"
-    return VIDEO_TAG_RE.sub(replacement_line, template_text, count=1)
+    return (
+        template_text[:m.start()] + f"{indent}<VideoCardDescription>",
+        "</VideoCardDescription>" + template_text[m.end():],
+    )
+
+
+# Встроенный шаблон режем один раз при импорте — дальше только склейка строк
+_TEMPLATE_PARTS = split_template(TEMPLATE_XML)
+
+
+def apply_videocard_description(template_text: str, gpu_name: str) -> str:
+    before, after = split_template(template_text)
+    return before + html.escape(gpu_name, quote=False) + after
 
 
-def taskkill(image_name: str) -> None:
-    subprocess.run(["taskkill", "/F", "/T", "/IM", image_name], capture_output=True, text=True)
+def render_default_template(gpu_name: str) -> str:
+    """Встроенный TEMPLATE_XML с названием GPU — без повторного поиска тега"""
+    before, after = _TEMPLATE_PARTS
+    return before + html.escape(gpu_name, quote=False) + after
+
+
+def kill_processes(image_names) -> None:
+    """Один запуск taskkill на все процессы: /IM можно повторять"""
+    args = ["taskkill", "/F", "/T"]
+    for image_name in image_names:
+        args += ["/IM", image_name]
+    subprocess.run(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
 
 KILL_LIST = [
@@ -187,7 +272,8 @@ KILL_LIST = [
 ]
 
 
-def write_atomic(target_path: Path, content: str) -> None:
+def write_atomic(target_path: Path, content: str, durable: bool = False) -> None:
+    """Write via temp file + os.replace; fsync only when durable=True"""
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
     with tempfile.NamedTemporaryFile(
@@ -200,8 +286,9 @@ def write_atomic(target_path: Path, content: str) -> None:
     ) as tmp:
         tmp_path = Path(tmp.name)
         tmp.write(content)
-        tmp.flush()
-        os.fsync(tmp.fileno())
+        if durable:
+            tmp.flush()
+            os.fsync(tmp.fileno())
 
     try:
         os.replace(tmp_path, target_path)
@@ -211,10 +298,25 @@ def write_atomic(target_path: Path, content: str) -> None:
         os.replace(tmp_path, target_path)
 
 
-def update_gta_settings(kill_on_failure: bool = True) -> bool:
+def is_file_locked(path: Path) -> bool:
+    """Дешёвая проверка: можно ли открыть файл на запись (без создания и усечения)"""
+    try:
+        fd = os.open(str(path), os.O_WRONLY)
+    except FileNotFoundError:
+        return False
+    except PermissionError:
+        return True
+    os.close(fd)
+    return False
+
+
+def update_gta_settings(kill_on_failure: bool = True, refresh_gpu: bool = False) -> bool:
     """
     Обновить settings.xml для GTA V с правильным GPU.
     
+    Args:
+        refresh_gpu: Определить GPU заново, минуя кэш
+    
     Returns:
         True если успешно
         False если ошибка
@@ -224,7 +326,7 @@ def update_gta_settings(kill_on_failure: bool = True) -> bool:
     logger.info("=" * 50)
     
     # Определяем GPU
-    gpu_name = get_gpu_name()
+    gpu_name = get_gpu_name(refresh=refresh_gpu)
     if not gpu_name:
         logger.warning("Could not detect GPU, using default")
         gpu_name = "NVIDIA GeForce GTX 1060"
@@ -233,7 +335,7 @@ def update_gta_settings(kill_on_failure: bool = True) -> bool:
     
     # Генерируем конфиг
     try:
-        updated_text = apply_videocard_description(TEMPLATE_XML, gpu_name)
+        updated_text = render_default_template(gpu_name)
     except Exception as e:
         logger.error(f"Failed to generate config: {e}")
         return False
@@ -244,14 +346,16 @@ def update_gta_settings(kill_on_failure: bool = True) -> bool:
     
     for attempt in range(3):
         try:
+            # Занятый файл видно сразу — не пишем tmp-файл, который всё равно не заменит цель
+            if is_file_locked(target_path):
+                raise PermissionError(f"{target_path} is locked")
             write_atomic(target_path, updated_text)
             logger.info("✅ Settings written successfully!")
             return True
         except PermissionError:
             if kill_on_failure and attempt < 2:
                 logger.warning("File locked, killing GTA processes...")
-                for proc in KILL_LIST:
-                    taskkill(proc)
+                kill_processes(KILL_LIST)
                 time.sleep(0.5)
             else:
                 logger.error("❌ Cannot write settings (file locked)")
@@ -264,5 +368,5 @@ def update_gta_settings(kill_on_failure: bool = True) -> bool:
 
 
 if __name__ == "__main__":
-    success = update_gta_settings()
+    success = update_gta_settings(refresh_gpu="--refresh-gpu" in sys.argv[1:])
     sys.exit(0 if success else 1)
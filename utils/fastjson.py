@@ -0,0 +1,20 @@
+"""
+Быстрый JSON: orjson, если установлен, иначе стандартный json.
+
+Обе реализации работают с bytes: loads принимает bytes/str, dumps возвращает bytes.
+"""
+
+import json
+
+try:
+    import orjson
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+__all__ = ["loads", "dumps"]
@@ -0,0 +1,13 @@
+"""
+Возможности HTTP-клиента, определяемые один раз на процесс.
+"""
+
+# HTTP/2 в httpx требует пакет h2; без него остаёмся на HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+__all__ = ["HTTP2_AVAILABLE"]
@@ -7,11 +7,47 @@
 - Нет интернета → пробуем восстановить подключение
 """
 
+import atexit
+import bisect
+import functools
 import httpx
 import ipaddress
-from typing import List, Tuple, Union
+import socket
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import List, Tuple
 from enum import Enum
 
+from utils.http import HTTP2_AVAILABLE
+
+
+# Сервисы "какой у меня IP": опрашиваем параллельно, берём первый валидный ответ.
+# Только IPv4-ответы — blacklist у нас IPv4, IPv6-адрес прошёл бы проверку ложно
+_IP_PROVIDERS = (
+    "https://api.ipify.org",
+    "https://ipv4.icanhazip.com",
+    "https://ifconfig.me/ip",
+)
+_IP_DEADLINE = 5  # секунд на всю гонку
+# Запросы первой гонки могут ещё висеть после дедлайна (connect 2 с + read 5 с);
+# вдвое больше потоков — чтобы повтор не ждал их в очереди
+_IP_EXECUTOR = ThreadPoolExecutor(max_workers=2 * len(_IP_PROVIDERS), thread_name_prefix="ip-echo")
+
+# Один клиент на процесс: TCP+TLS к ipify переиспользуется между проверками
+_HTTP = httpx.Client(
+    http2=HTTP2_AVAILABLE,
+    # Живой сервис отвечает за ~200 мс; мёртвый маршрут не должен держать проверку 10 с
+    timeout=httpx.Timeout(5.0, connect=2.0),
+    # Соединений не меньше, чем потоков _IP_EXECUTOR: иначе повтор ждёт
+    # свободного соединения столько же, сколько длится вся гонка
+    limits=httpx.Limits(
+        max_keepalive_connections=len(_IP_PROVIDERS) + 1,
+        max_connections=max(8, 2 * len(_IP_PROVIDERS)),
+    ),
+)
+atexit.register(_HTTP.close)
+
 
 class IPStatus(Enum):
     """Статус проверки IP"""
@@ -22,36 +58,104 @@ class IPStatus(Enum):
 
 # Заблокированные IP адреса и диапазоны (домашние/офисные ПК)
 # На этих IP фарм НЕ запускается
-BLOCKED_IPS: List[Union[str, Tuple[str, str]]] = [
+# Формат: CIDR ("a.b.c.d/len"), отдельный IP — /32
+BLOCKED_IPS: List[str] = [
     # Отдельные IP
-    "212.220.204.72",
-    "217.73.89.128",
+    "212.220.204.72/32",
+    "217.73.89.128/32",
     
-    # Диапазоны (первый IP, последний IP)
-    ("79.142.197.0", "79.142.197.255"),
-    ("217.73.88.0", "217.73.91.255"),
-    ("185.70.0.0", "185.70.255.255"),
+    # Сети
+    "79.142.197.0/24",   # 79.142.197.0 — 79.142.197.255
+    "217.73.88.0/22",    # 217.73.88.0 — 217.73.91.255
+    "185.70.0.0/16",     # 185.70.0.0 — 185.70.255.255
 ]
 
 
-def get_external_ip() -> str:
-    """Получить внешний IP адрес"""
-    try:
-        response = httpx.get("https://api.ipify.org", timeout=10)
-        return response.text.strip()
-    except Exception:
-        return ""
+# Кэш внешнего IP: повторные проверки (heartbeat и т.п.) не ходят в сеть
+_IP_TTL = 300  # секунд
+_IP_CACHE = {"ip": "", "ts": 0.0}
+
+
+def get_external_ip(force_refresh: bool = False) -> str:
+    """Получить внешний IP адрес (из кэша, если он свежее _IP_TTL)"""
+    if not force_refresh and _IP_CACHE["ip"] and time.monotonic() - _IP_CACHE["ts"] < _IP_TTL:
+        return _IP_CACHE["ip"]
+    
+    # Один повтор, если не ответил ни один сервис (обрыв/таймаут)
+    ip = _race_providers() or _race_providers()
+    if ip:
+        _IP_CACHE["ip"] = ip
+        _IP_CACHE["ts"] = time.monotonic()
+    return ip
 
 
+def _race_providers() -> str:
+    """Первый валидный IP от _IP_PROVIDERS за _IP_DEADLINE или пустая строка"""
+    futures = [_IP_EXECUTOR.submit(_fetch_ip, url) for url in _IP_PROVIDERS]
+    try:
+        for future in as_completed(futures, timeout=_IP_DEADLINE):
+            try:
+                return future.result()
+            except Exception:
+                continue
+    except FuturesTimeout:
+        pass
+    finally:
+        # Остальные ответы не нужны
+        for future in futures:
+            future.cancel()
+    return ""
+
+
+def _fetch_ip(url: str) -> str:
+    """IP от одного сервиса; ValueError, если ответ не IPv4-адрес"""
+    ip = _HTTP.get(url).text.strip()
+    ipaddress.IPv4Address(ip)
+    return ip
+
+
+@functools.lru_cache(maxsize=256)
 def ip_to_int(ip: str) -> int:
-    """Конвертировать IP в число для сравнения диапазонов"""
-    return int(ipaddress.ip_address(ip))
+    """
+    Конвертировать IPv4 в число для сравнения диапазонов.
+    Без объектов ipaddress: inet_pton + struct. OSError — не IPv4-адрес.
+    """
+    return struct.unpack(">I", socket.inet_pton(socket.AF_INET, ip))[0]
 
 
-def is_ip_in_range(ip: str, start: str, end: str) -> bool:
-    """Проверить входит ли IP в диапазон"""
-    ip_int = ip_to_int(ip)
-    return ip_to_int(start) <= ip_int <= ip_to_int(end)
+def _build_blocked_ranges() -> List[Tuple[int, int]]:
+    """
+    BLOCKED_IPS → отсортированные непересекающиеся диапазоны (start_int, end_int).
+    Вложенные/смежные сети сливаются.
+    """
+    ranges = [
+        (int(net.network_address), int(net.broadcast_address))
+        for net in map(ipaddress.IPv4Network, BLOCKED_IPS)
+    ]
+    
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _build_prefix16_bitset() -> bytearray:
+    """Бит на каждый /16-префикс, который задевает хотя бы один диапазон (65536 бит)"""
+    bits = bytearray(8192)
+    for start, end in _BLOCKED_RANGES:
+        for p in range(start >> 16, (end >> 16) + 1):
+            bits[p >> 3] |= 1 << (p & 7)
+    return bits
+
+
+# Считаем один раз при импорте
+_BLOCKED_RANGES = _build_blocked_ranges()
+_RANGE_STARTS = [start for start, _ in _BLOCKED_RANGES]
+# Быстрый отсев: почти все IP не в blacklist и их /16 не задет ни одним диапазоном
+_PREFIX16 = _build_prefix16_bitset()
 
 
 def is_ip_blocked(ip: str) -> bool:
@@ -59,23 +163,27 @@ def is_ip_blocked(ip: str) -> bool:
     if not ip:
         return False
     
-    for item in BLOCKED_IPS:
-        if isinstance(item, str):
-            # Отдельный IP
-            if ip == item:
-                return True
-        elif isinstance(item, tuple) and len(item) == 2:
-            # Диапазон
-            if is_ip_in_range(ip, item[0], item[1]):
-                return True
+    try:
+        ip_int = ip_to_int(ip)
+    except OSError:
+        return False  # IPv6 — в списке только IPv4
+    
+    p = ip_int >> 16
+    if not (_PREFIX16[p >> 3] & (1 << (p & 7))):
+        return False
     
-    return False
+    # Последний диапазон, начинающийся не позже ip
+    idx = bisect.bisect_right(_RANGE_STARTS, ip_int) - 1
+    return idx >= 0 and ip_int <= _BLOCKED_RANGES[idx][1]
 
 
-def check_ip_access() -> Tuple[IPStatus, str]:
+def check_ip_access(force_refresh: bool = False) -> Tuple[IPStatus, str]:
     """
     Проверить статус IP клиента.
     
+    Args:
+        force_refresh: Не брать IP из кэша (после смены VPN IP меняется)
+    
     Returns:
         (status: IPStatus, ip: str)
         
@@ -84,7 +192,7 @@ def check_ip_access() -> Tuple[IPStatus, str]:
         - BLOCKED: IP в blacklist, фарм не запускаем
         - NO_INTERNET: Нет подключения, нужно восстановить
     """
-    ip = get_external_ip()
+    ip = get_external_ip(force_refresh=force_refresh)
     
     if not ip:
         return IPStatus.NO_INTERNET, ""
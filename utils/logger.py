@@ -1,13 +1,17 @@
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
 import platform
-from datetime import datetime
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from config import LOGS_DIR
 
 # Get machine name for logs
+@functools.lru_cache(maxsize=1)
 def get_machine_name() -> str:
     """Get machine name for logging (uses platform.node() for full name)"""
     # platform.node() returns full computer name (e.g. DESKTOP-IOPA6D8T1)
@@ -20,9 +24,21 @@ MACHINE_NAME = get_machine_name()
 LOG_FORMAT = f"%(asctime)s | %(levelname)-5s | [{MACHINE_NAME}] | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Один formatter на все handlers
+_FMT = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+
+# Повторный setup_logger не пересоздаёт handlers и не переоткрывает файл лога
+_CONFIGURED = False
+
+# Фоновый поток, который пишет записи в консоль и файл
+_LISTENER: Optional[QueueListener] = None
+
 
 def setup_logger(name: str = "virtbot") -> logging.Logger:
     """Настройка логгера с файловым выводом для всех модулей"""
+    global _CONFIGURED, _LISTENER
+    if _CONFIGURED:
+        return logging.getLogger(name)
     
     # Настраиваем root logger для всех модулей
     root_logger = logging.getLogger()
@@ -35,8 +51,7 @@ def setup_logger(name: str = "virtbot") -> logging.Logger:
     # Консольный handler (INFO и выше)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(_FMT)
     
     # Файловый handler с автоматической ротацией (INFO и выше)
     # Ротация происходит в полночь, хранятся файлы за последние 30 дней
@@ -53,8 +68,22 @@ def setup_logger(name: str = "virtbot") -> logging.Logger:
     # Формат имени для ротированных файлов: bot.log.2026-01-01
     file_handler.suffix = "%Y-%m-%d"
     file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-    root_logger.addHandler(file_handler)
+    file_handler.setFormatter(_FMT)
+    
+    # Логирующий поток только кладёт запись в очередь; форматирование,
+    # запись и flush в консоль/файл выполняет QueueListener в своём потоке.
+    # Там же происходит и полуночная ротация bot.log (переименование, удаление старых)
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Уровень = минимальный у handlers listener'а: DEBUG отбрасывается сразу,
+    # без форматирования в prepare() и без постановки в очередь
+    queue_handler.setLevel(logging.INFO)
+    root_logger.addHandler(queue_handler)
+    _LISTENER = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _LISTENER.start()
+    # stop() дописывает оставшиеся в очереди записи при выходе
+    atexit.register(_LISTENER.stop)
+    _CONFIGURED = True
     
     # Возвращаем named logger
     logger = logging.getLogger(name)
@@ -13,10 +13,17 @@ VPN Manager — управление VPN подключениями.
 
 import subprocess
 import os
+import time
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import NamedTuple, Optional, List, Set, Tuple
 from utils import get_logger
 
+# psutil читает список процессов напрямую из ОС, без запуска tasklist
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 logger = get_logger()
 
 
@@ -33,57 +40,148 @@ VPN_APPS = {
 }
 
 
+class _VpnEntry(NamedTuple):
+    """VPN_APPS в готовом для проверок виде"""
+    name: str
+    proc_lc: str  # process_name в lowercase
+    install_path: Path
+
+
+# Считаем один раз при импорте: без .lower() и Path() на каждой проверке
+_VPNS = tuple(
+    _VpnEntry(name, cfg["process_name"].lower(), Path(cfg["install_path"]))
+    for name, cfg in VPN_APPS.items()
+)
+_VPN_BY_NAME = {vpn.name: vpn for vpn in _VPNS}
+
+# Установленность за время работы бота не меняется: проверяем диск один раз при импорте.
+# refresh_installed() — перепроверить вручную
+_INSTALLED = {vpn.name: vpn.install_path.exists() for vpn in _VPNS}
+
+
+# Снимок процессов живёт PROCESS_CACHE_TTL секунд: состояние VPN так быстро не меняется
+PROCESS_CACHE_TTL = 2.0
+_procs_cache: Tuple[Set[str], float] = (set(), 0.0)  # (процессы, истекает в monotonic)
+
+
 def is_process_running(process_name: str) -> bool:
     """Проверить запущен ли процесс"""
+    if psutil is not None:
+        return process_name.lower() in running_processes()
     try:
+        # /FI оставляет только совпавшие строки; в CSV они начинаются с кавычки,
+        # а "нет задач" — локализованное сообщение без кавычек
         result = subprocess.run(
-            ["tasklist", "/FI", f"IMAGENAME eq {process_name}"],
+            ["tasklist", "/FI", f"IMAGENAME eq {process_name}", "/FO", "CSV", "/NH"],
             capture_output=True,
             text=True,
             timeout=10
         )
-        return process_name.lower() in result.stdout.lower()
+        return result.stdout.lstrip().startswith('"')
     except Exception as e:
         logger.error(f"Error checking process {process_name}: {e}")
         return False
 
 
-def is_vpn_installed(vpn_name: str) -> bool:
-    """Проверить установлен ли VPN"""
-    if vpn_name not in VPN_APPS:
-        return False
+def running_processes() -> Set[str]:
+    """Имена всех запущенных процессов (lowercase) — одно перечисление на все проверки"""
+    if psutil is not None:
+        return {
+            p.info["name"].lower()
+            for p in psutil.process_iter(["name"])
+            if p.info["name"]
+        }
     
-    install_path = VPN_APPS[vpn_name]["install_path"]
-    return Path(install_path).exists()
+    try:
+        result = subprocess.run(
+            ["tasklist", "/FO", "CSV", "/NH"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except Exception as e:
+        logger.error(f"Error listing processes: {e}")
+        return set()
+    # "AmneziaVPN.exe","1234","Console","1","12 345 K"
+    return {
+        row.split(",", 1)[0].strip('"').lower()
+        for row in result.stdout.splitlines()
+        if row
+    }
+
+
+def _cached_running_procs() -> Set[str]:
+    """running_processes() с TTL-кэшем"""
+    global _procs_cache
+    procs, expiry = _procs_cache
+    if time.monotonic() < expiry:
+        return procs
+    procs = running_processes()
+    _procs_cache = (procs, time.monotonic() + PROCESS_CACHE_TTL)
+    return procs
+
+
+def _invalidate_procs_cache():
+    """Сбросить снимок процессов (после запуска VPN)"""
+    global _procs_cache
+    _procs_cache = (set(), 0.0)
+
 
+def refresh_installed():
+    """Перепроверить на диске, какие VPN установлены (например после установки)"""
+    _INSTALLED.update({vpn.name: vpn.install_path.exists() for vpn in _VPNS})
 
-def is_vpn_running(vpn_name: str) -> bool:
-    """Проверить запущен ли VPN процесс"""
-    if vpn_name not in VPN_APPS:
+
+def is_vpn_installed(vpn_name: str) -> bool:
+    """Проверить установлен ли VPN (по снимку _INSTALLED, без обращения к диску)"""
+    return _INSTALLED.get(vpn_name, False)
+
+
+def is_vpn_running(vpn_name: str, procs: Optional[Set[str]] = None) -> bool:
+    """
+    Проверить запущен ли VPN процесс.
+    procs — готовый снимок процессов; по умолчанию кэшированный (TTL PROCESS_CACHE_TTL).
+    """
+    vpn = _VPN_BY_NAME.get(vpn_name)
+    if vpn is None:
         return False
     
-    process_name = VPN_APPS[vpn_name]["process_name"]
-    return is_process_running(process_name)
+    if procs is None:
+        procs = _cached_running_procs()
+    return vpn.proc_lc in procs
 
 
 def start_vpn(vpn_name: str) -> bool:
     """Запустить VPN приложение"""
-    if vpn_name not in VPN_APPS:
+    vpn = _VPN_BY_NAME.get(vpn_name)
+    if vpn is None:
         logger.warning(f"Unknown VPN: {vpn_name}")
         return False
     
-    install_path = VPN_APPS[vpn_name]["install_path"]
-    
-    if not Path(install_path).exists():
-        logger.warning(f"{vpn_name} not installed at {install_path}")
+    if not vpn.install_path.exists():
+        logger.warning(f"{vpn_name} not installed at {vpn.install_path}")
         return False
     
     try:
         logger.info(f"🚀 Starting {vpn_name}...")
+        # Окно скрыто, без консоли и без наследования хэндлов/пайпов от бота
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
         subprocess.Popen(
-            [install_path],
-            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS
+            [str(vpn.install_path)],
+            startupinfo=startupinfo,
+            creationflags=(
+                subprocess.CREATE_NO_WINDOW
+                | subprocess.DETACHED_PROCESS
+                | subprocess.CREATE_NEW_PROCESS_GROUP
+            ),
+            close_fds=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
+        _invalidate_procs_cache()
         return True
     except Exception as e:
         logger.error(f"Failed to start {vpn_name}: {e}")
@@ -92,13 +190,14 @@ def start_vpn(vpn_name: str) -> bool:
 
 def get_vpn_status() -> dict:
     """Получить статус всех VPN"""
-    status = {}
-    for vpn_name, config in VPN_APPS.items():
-        status[vpn_name] = {
-            "installed": is_vpn_installed(vpn_name),
-            "running": is_vpn_running(vpn_name),
+    procs = _cached_running_procs()
+    return {
+        vpn.name: {
+            "installed": is_vpn_installed(vpn.name),
+            "running": vpn.proc_lc in procs,
         }
-    return status
+        for vpn in _VPNS
+    }
 
 
 def try_start_any_vpn() -> Tuple[bool, List[str]]:
@@ -109,35 +208,31 @@ def try_start_any_vpn() -> Tuple[bool, List[str]]:
         (success: bool, started: list of vpn names that were started)
     """
     started = []
+    procs = _cached_running_procs()
     
-    for vpn_name in VPN_APPS:
+    for vpn in _VPNS:
         # Если уже запущен — пропускаем
-        if is_vpn_running(vpn_name):
-            logger.info(f"✅ {vpn_name} already running")
+        if vpn.proc_lc in procs:
+            logger.info(f"✅ {vpn.name} already running")
             continue
         
         # Если установлен — запускаем
-        if is_vpn_installed(vpn_name):
-            if start_vpn(vpn_name):
-                started.append(vpn_name)
+        if is_vpn_installed(vpn.name):
+            if start_vpn(vpn.name):
+                started.append(vpn.name)
     
     return len(started) > 0, started
 
 
 def any_vpn_running() -> bool:
     """Проверить запущен ли хотя бы один VPN"""
-    for vpn_name in VPN_APPS:
-        if is_vpn_running(vpn_name):
-            return True
-    return False
+    procs = _cached_running_procs()
+    return any(vpn.proc_lc in procs for vpn in _VPNS)
 
 
 def any_vpn_installed() -> bool:
     """Проверить установлен ли хотя бы один VPN"""
-    for vpn_name in VPN_APPS:
-        if is_vpn_installed(vpn_name):
-            return True
-    return False
+    return any(is_vpn_installed(vpn.name) for vpn in _VPNS)
 
 
 # Тест